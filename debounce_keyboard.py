@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Script ini memastikan library yang diperlukan (evdev, python-uinput, pygame, ttkthemes) terinstal.
+Script ini memastikan library yang diperlukan (evdev, python-uinput, pygame, ttkthemes, orjson) terinstal.
 Aplikasi dapat dijalankan dengan GUI (default) atau dalam mode background (--nogui).
 Konfigurasi (global bounce threshold, batas khusus per tombol, shortcut pause/continue, mode deteksi,
 advanced settings, dsb.) serta log akan disimpan secara persisten dalam direktori yang sama
@@ -10,13 +10,24 @@ instance sebelumnya akan dihentikan dan aplikasi akan direstart.
 
 import sys
 import os
+import re
 import json
 import subprocess
 import threading
 import time
 import atexit
 import signal
+import fcntl
 import queue
+import array
+import select
+import collections
+import itertools
+import heapq
+import bisect
+import string
+import functools
+import importlib
 
 # Pastikan dijalankan dengan Python 3
 if sys.version_info[0] < 3:
@@ -68,23 +79,30 @@ except ImportError:
     install_package("ttkthemes")
     from ttkthemes import ThemedTk
 
+# Pastikan orjson terpasang (serialisasi log JSON yang jauh lebih cepat dari json bawaan)
+try:
+    import orjson
+except ImportError:
+    install_package("orjson")
+    import orjson
+
 # Jika dijalankan dengan sudo, ambil UID user asli dan tetapkan XDG_RUNTIME_DIR-nya
 if os.getuid() == 0 and "SUDO_UID" in os.environ:
     sudo_uid = os.environ["SUDO_UID"]
     os.environ["XDG_RUNTIME_DIR"] = f"/run/user/{sudo_uid}"
 os.environ['SDL_AUDIODRIVER'] = 'alsa'
 
+# Mixer baru di-init saat suara pertama diputar (lihat play_sound), bukan saat
+# import, dan objek Sound di-cache per nama file agar WAV tidak di-decode ulang.
 sound_enabled = True
-try:
-    pygame.mixer.init()
-except pygame.error as e:
-    print(f"Audio device error: {e}. Efek suara dinonaktifkan.")
-    sound_enabled = False
+sound_mixer_ready = False
+sound_cache = {}
+sound_lock = threading.Lock()
 
 import tkinter as tk
 from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
-from evdev import InputDevice, categorize, ecodes, list_devices
+from evdev import InputDevice, ecodes, list_devices
 
 # --------------------------------------------------------------------
 # DEFINISI BASE DIRECTORY
@@ -95,11 +113,11 @@ config_file = os.path.join(script_dir, "config.txt")
 log_input_file = os.path.join(script_dir, "log_input.txt")
 log_bounce_file = os.path.join(script_dir, "log_bounce.txt")
 pid_file = os.path.join(script_dir, "debounce_keyboard.pid")
+stats_file = os.path.join(script_dir, "stats.json")
 
 def ensure_file_exists(filepath):
-    if not os.path.exists(filepath):
-        with open(filepath, "w") as f:
-            f.write("")
+    # Mode "a" membuat file bila belum ada tanpa menyentuh isinya (tanpa stat dulu)
+    open(filepath, "a").close()
 
 ensure_file_exists(config_file)
 ensure_file_exists(log_input_file)
@@ -108,25 +126,57 @@ ensure_file_exists(log_bounce_file)
 # --------------------------------------------------------------------
 # SINGLE INSTANCE
 # --------------------------------------------------------------------
+# Instance yang berjalan memegang flock pada pid_file selama hidupnya; lock
+# otomatis lepas saat proses mati (termasuk crash), jadi tidak perlu menebak
+# dari isi file apakah PID lama masih hidup.
+PID_LOCK_TIMEOUT = 5.0  # detik menunggu instance lama berhenti
+
+pid_fd = os.open(pid_file, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+
 def remove_pid_file():
-    if os.path.exists(pid_file):
-        os.remove(pid_file)
+    # File tidak di-unlink: instance baru mungkin sudah membuka file yang sama
+    # dan sedang menunggu lock. Cukup kosongkan isinya sebelum lock dilepas.
+    try:
+        os.ftruncate(pid_fd, 0)
+    except OSError:
+        pass
 
-atexit.register(remove_pid_file)
+def handle_sigterm(signum, frame):
+    """
+    SIGTERM (dari instance baru atau systemd) diubah menjadi SystemExit
+    agar handler atexit (hapus PID, flush log) tetap dijalankan.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    sys.exit(0)
+
+signal.signal(signal.SIGTERM, handle_sigterm)
+
+def try_lock_pid_file():
+    try:
+        fcntl.flock(pid_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
 
-if os.path.exists(pid_file):
+if not try_lock_pid_file():
     try:
-        with open(pid_file, "r") as f:
-            old_pid = int(f.read().strip())
-        os.kill(old_pid, 0)
-        os.kill(old_pid, signal.SIGTERM)
-        time.sleep(1)
-        print("Instance sudah berjalan. Instance sebelumnya telah dihentikan dan aplikasi akan direstart.")
+        old_pid = int(os.pread(pid_fd, 32, 0).decode().strip() or 0)
+        if old_pid > 0:
+            os.kill(old_pid, signal.SIGTERM)
     except Exception:
         pass
+    deadline = time.monotonic() + PID_LOCK_TIMEOUT
+    while not try_lock_pid_file():
+        if time.monotonic() > deadline:
+            print("Instance sebelumnya tidak berhenti, aplikasi dibatalkan.")
+            sys.exit(1)
+        time.sleep(0.02)
+    print("Instance sudah berjalan. Instance sebelumnya telah dihentikan dan aplikasi akan direstart.")
+
+atexit.register(remove_pid_file)
 
-with open(pid_file, "w") as f:
-    f.write(str(os.getpid()))
+os.ftruncate(pid_fd, 0)
+os.pwrite(pid_fd, str(os.getpid()).encode(), 0)
 
 # --------------------------------------------------------------------
 # KONFIGURASI & VAR GLOB
@@ -134,6 +184,9 @@ with open(pid_file, "w") as f:
 bounce_time = 0.1   # (default 100 ms)
 current_language = 'id'  # 'id' atau 'en'
 custom_thresholds = {}
+# Salinan threshold dalam nanodetik (int) untuk perbandingan di loop monitor,
+# lihat refresh_thresholds_ns() dan thresholds_ns_by_code
+bounce_time_ns = 100_000_000
 shortcut_pause = ""
 shortcut_continue = ""
 paused = False
@@ -145,184 +198,521 @@ manual_continue = False
 bounce_mode = "down"
 
 # QEMU
+QEMU_CHECK_INTERVAL = 0.5  # detik
 force_disable_qemu = False
 _last_qemu_check = 0
 _qemu_active = False
+# Cache hasil scan proses QEMU untuk is_qemu_kvm_active(): (waktu monotonic, hasil)
+_qemu_scan_cache = (float('-inf'), False)
 
-# Grab
+# Grab. global_keyboard_grabbed hanya diubah lewat set_keyboard_grabbed();
+# _prev_keyboard_grabbed = status yang terakhir ditampilkan indikator GUI.
 global_keyboard_grabbed = False
 _prev_keyboard_grabbed = None
 forced_pause = False
 
-# Logging (disimpan di memori, lalu ditampilkan di GUI)
-input_events = []
-bounce_events = []
+# Logging (disimpan di memori, lalu ditampilkan di GUI).
+# Hanya LOG_MEMORY_MAX event terakhir yang disimpan; riwayat lengkap tetap di file log.
+LOG_MEMORY_MAX = 10000
+input_events = collections.deque(maxlen=LOG_MEMORY_MAX)
+bounce_events = collections.deque(maxlen=LOG_MEMORY_MAX)
 
 repeat_rate = 30
 repeat_delay = 0.3
 
-last_press_time_per_key = {}
-last_release_time_per_key = {}
-keys_were_down_blocked = {}
+# State per tombol diindeks langsung dengan keycode (event.code), bukan nama
+# tombol. Waktu dalam nanodetik CLOCK_MONOTONIC (lihat
+# use_monotonic_event_clock); 0 = tombol belum pernah diproses.
+KEY_MAX = ecodes.KEY_MAX + 1
+
+# Mode "up": waktu release terakhir yang diteruskan, dan
+# keys_were_down_blocked[code] = 1 jika DOWN terakhir diblok sebagai bounce.
+last_release_time_per_key = array.array('q', [0]) * KEY_MAX
+keys_were_down_blocked = bytearray(KEY_MAX)
 
-last_valid_down_time_per_key = {}
-valid_keys = {}
-first_event_down_per_key = set()
+# Mode "down": valid_keys[code] = 1 jika DOWN diteruskan.
+last_valid_down_time_per_key = array.array('q', [0]) * KEY_MAX
+valid_keys = bytearray(KEY_MAX)
+
+# thresholds_ns_by_code[code] = threshold (ns) untuk keycode itu: threshold
+# custom jika ada, selain itu bounce_time_ns. Satu index array per event,
+# tanpa probe dict custom_thresholds. Diisi ulang oleh refresh_thresholds_ns().
+thresholds_ns_by_code = array.array('q', [100_000_000]) * KEY_MAX
+
+# shortcut_*_keys[code] = 1 jika keycode itu adalah tombol shortcut, lihat
+# refresh_shortcut_keys(). Loop monitor cukup membaca satu byte per event,
+# bukan membandingkan string nama tombol. Diubah in-place agar alias lokal
+# di monitor_keyboard tetap valid.
+shortcut_pause_keys = bytearray(KEY_MAX)
+shortcut_continue_keys = bytearray(KEY_MAX)
 
 # --------------------------------------------------------------------
 # STATISTIK
 # --------------------------------------------------------------------
-stats_data = {}
-# stats_data[key] = { "press": int, "bounce": int, "time_added": float }
+# Statistik per tombol disimpan per kolom (struct-of-arrays): indeks i pada
+# stats_keys/stats_press/stats_bounce/stats_percent/stats_time_added adalah
+# satu tombol. Sort di tab statistik cukup mengurutkan indeks terhadap satu
+# kolom array, tanpa membuat tuple/dict per baris.
+stats_keys = []
+stats_index = {}  # key_name -> indeks
+stats_press = array.array('q')
+stats_bounce = array.array('q')
+stats_percent = array.array('d')  # cache % bounce, diperbarui saat press/bounce berubah
+# Teks "12.3%" untuk kolom tabel; None = perlu diformat ulang (lihat stats_row_values)
+stats_percent_text = []
+stats_time_added = array.array('d')
 
 stats_tree = None
 custom_tree = None
 
+def calc_stats_percent(press, bounce):
+    if press == 0:
+        return 0.0
+    return (bounce / press) * 100.0
+
+def add_stats_key(key_name, press=0, bounce=0, time_added=None):
+    idx = len(stats_keys)
+    stats_index[key_name] = idx
+    stats_keys.append(key_name)
+    stats_press.append(press)
+    stats_bounce.append(bounce)
+    stats_percent.append(calc_stats_percent(press, bounce))
+    stats_percent_text.append(None)
+    stats_time_added.append(time.time() if time_added is None else time_added)
+    return idx
+
+def clear_stats():
+    stats_keys.clear()
+    stats_index.clear()
+    del stats_press[:]
+    del stats_bounce[:]
+    del stats_percent[:]
+    stats_percent_text.clear()
+    del stats_time_added[:]
+
 def record_stats_press(key_name):
     """
     Tambah 'press' di stats, sekaligus set time_added jika key_name baru.
     (Fungsi ini nantinya hanya dipanggil di main thread.)
     """
-    if key_name not in stats_data:
-        stats_data[key_name] = {
-            "press": 0,
-            "bounce": 0,
-            "time_added": time.time()
-        }
-    stats_data[key_name]["press"] += 1
+    idx = stats_index.get(key_name)
+    if idx is None:
+        idx = add_stats_key(key_name)
+    stats_press[idx] += 1
+    stats_percent[idx] = calc_stats_percent(stats_press[idx], stats_bounce[idx])
+    stats_percent_text[idx] = None
     update_stats_row(key_name)
 
 def record_stats_bounce(key_name):
     """
     Tambah 'bounce' di stats. (Hanya di main thread.)
     """
-    if key_name not in stats_data:
-        stats_data[key_name] = {
-            "press": 0,
-            "bounce": 0,
-            "time_added": time.time()
-        }
-    stats_data[key_name]["bounce"] += 1
+    idx = stats_index.get(key_name)
+    if idx is None:
+        idx = add_stats_key(key_name)
+    stats_bounce[idx] += 1
+    stats_percent[idx] = calc_stats_percent(stats_press[idx], stats_bounce[idx])
+    stats_percent_text[idx] = None
     update_stats_row(key_name)
 
 # --------------------------------------------------------------------
 # LOAD & SAVE CONFIG
 # --------------------------------------------------------------------
-def load_config():
-    global bounce_time, current_language, custom_thresholds
-    global shortcut_pause, shortcut_continue, force_disable_qemu
-    global bounce_mode, repeat_rate, repeat_delay
+# Satu handler per kunci config.txt; load_config cukup memecah "kunci=nilai"
+# sekali per baris lalu lookup handler di CONFIG_HANDLERS.
+def config_set_threshold(val):
+    global bounce_time
+    try:
+        bounce_time = float(val) / 1000.0
+    except:
+        pass
+
+def config_set_language(val):
+    global current_language
+    current_language = val.strip()
 
-    if os.path.exists(config_file):
+def config_set_custom_thresholds(val):
+    global custom_thresholds
+    try:
+        custom_thresholds = json.loads(val)
+    except:
+        custom_thresholds = {}
+
+def config_set_shortcut_pause(val):
+    global shortcut_pause
+    try:
+        shortcut_pause = normalize_key(json.loads(val))
+    except:
+        shortcut_pause = ""
+
+def config_set_shortcut_continue(val):
+    global shortcut_continue
+    try:
+        shortcut_continue = normalize_key(json.loads(val))
+    except:
+        shortcut_continue = ""
+
+def config_set_force_disable_qemu(val):
+    global force_disable_qemu
+    force_disable_qemu = (val.strip().lower() == "true")
+
+def config_set_debounce_mode(val):
+    global bounce_mode
+    bounce_mode = val.strip().lower()
+
+def config_set_repeat_rate(val):
+    global repeat_rate
+    try:
+        repeat_rate = float(val)
+    except:
+        repeat_rate = 30
+
+def config_set_repeat_delay(val):
+    global repeat_delay
+    try:
+        repeat_delay = float(val) / 1000.0
+    except:
+        repeat_delay = 0.3
+
+CONFIG_HANDLERS = {
+    "threshold": config_set_threshold,
+    "language": config_set_language,
+    "custom_thresholds": config_set_custom_thresholds,
+    "shortcut_pause": config_set_shortcut_pause,
+    "shortcut_continue": config_set_shortcut_continue,
+    "force_disable_qemu": config_set_force_disable_qemu,
+    "debounce_mode": config_set_debounce_mode,
+    # hold_* adalah nama lama dari repeat_*
+    "hold_rate": config_set_repeat_rate,
+    "repeat_rate": config_set_repeat_rate,
+    "hold_delay": config_set_repeat_delay,
+    "repeat_delay": config_set_repeat_delay,
+}
+
+def load_config():
+    try:
         with open(config_file, "r") as f:
             for line in f:
-                line = line.strip()
-                if line.startswith("threshold="):
-                    try:
-                        val = float(line.split("=")[1])
-                        bounce_time = val / 1000.0
-                    except:
-                        pass
-                elif line.startswith("language="):
-                    current_language = line.split("=")[1].strip()
-                elif line.startswith("custom_thresholds="):
-                    try:
-                        custom_thresholds = json.loads(line.split("=",1)[1])
-                    except:
-                        custom_thresholds = {}
-                elif line.startswith("shortcut_pause="):
-                    try:
-                        shortcut_pause = normalize_key(json.loads(line.split("=",1)[1]))
-                    except:
-                        shortcut_pause = ""
-                elif line.startswith("shortcut_continue="):
-                    try:
-                        shortcut_continue = normalize_key(json.loads(line.split("=",1)[1]))
-                    except:
-                        shortcut_continue = ""
-                elif line.startswith("force_disable_qemu="):
-                    try:
-                        val = line.split("=",1)[1].strip().lower()
-                        force_disable_qemu = (val == "true")
-                    except:
-                        force_disable_qemu = False
-                elif line.startswith("debounce_mode="):
-                    try:
-                        bounce_mode = line.split("=",1)[1].strip().lower()
-                    except:
-                        bounce_mode = "down"
-                elif line.startswith("hold_rate=") or line.startswith("repeat_rate="):
-                    try:
-                        val = float(line.split("=")[1])
-                        repeat_rate = val
-                    except:
-                        repeat_rate = 30
-                elif line.startswith("hold_delay=") or line.startswith("repeat_delay="):
-                    try:
-                        val = float(line.split("=")[1])
-                        repeat_delay = val / 1000.0
-                    except:
-                        repeat_delay = 0.3
+                key, sep, val = line.strip().partition("=")
+                handler = CONFIG_HANDLERS.get(key)
+                if sep and handler:
+                    handler(val)
+    except FileNotFoundError:
+        pass
+
+    refresh_thresholds_ns()
+    refresh_shortcut_keys()
+    build_active_templates()
+
+def refresh_thresholds_ns():
+    """
+    Perbarui salinan threshold dalam nanodetik setiap kali bounce_time atau
+    custom_thresholds berubah, agar loop monitor cukup membandingkan int.
+    """
+    global bounce_time_ns
+    bounce_time_ns = round(bounce_time * 1e9)
+    custom_ns = {k: round(v * 1e9) for k, v in custom_thresholds.items()}
+    table = array.array('q', [bounce_time_ns]) * KEY_MAX
+    if custom_ns:
+        for code, name in enumerate(KEY_NAMES):
+            if name in custom_ns:
+                table[code] = custom_ns[name]
+    # Ditukar sekaligus (satu slice assignment) agar thread monitor tidak
+    # pernah melihat tabel setengah jadi; in-place agar alias lokalnya valid.
+    thresholds_ns_by_code[:] = table
+
+def refresh_shortcut_keys():
+    """
+    Isi ulang shortcut_pause_keys / shortcut_continue_keys dari nama shortcut
+    saat ini (semua keycode yang namanya sama dengan shortcut ditandai).
+    """
+    for table, shortcut in ((shortcut_pause_keys, shortcut_pause),
+                            (shortcut_continue_keys, shortcut_continue)):
+        table[:] = bytes(KEY_MAX)
+        if shortcut:
+            for code, name in enumerate(KEY_NAMES):
+                if name == shortcut:
+                    table[code] = 1
+
+def write_all(fd, data):
+    """
+    os.write bisa saja menulis sebagian; ulangi sampai semua bytes tertulis.
+    """
+    view = memoryview(data)
+    while view:
+        n = os.write(fd, view)
+        view = view[n:]
 
 def save_config():
-    with open(config_file, "w") as f:
-        f.write(f"threshold={int(bounce_time*1000)}\n")
-        f.write(f"language={current_language}\n")
-        f.write(f"custom_thresholds={json.dumps(custom_thresholds)}\n")
-        f.write(f"shortcut_pause={json.dumps(shortcut_pause)}\n")
-        f.write(f"shortcut_continue={json.dumps(shortcut_continue)}\n")
-        f.write(f"force_disable_qemu={str(force_disable_qemu)}\n")
-        f.write(f"debounce_mode={bounce_mode}\n")
-        f.write(f"repeat_rate={repeat_rate}\n")
-        f.write(f"repeat_delay={int(repeat_delay*1000)}\n")
+    """
+    Susun isi config sebagai satu blob bytes, tulis ke file sementara dengan
+    satu os.write, fsync, lalu os.replace ke config.txt. Config lama tetap utuh
+    bila proses mati di tengah penulisan.
+    """
+    payload = (
+        f"threshold={int(bounce_time*1000)}\n"
+        f"language={current_language}\n"
+        f"custom_thresholds={json.dumps(custom_thresholds)}\n"
+        f"shortcut_pause={json.dumps(shortcut_pause)}\n"
+        f"shortcut_continue={json.dumps(shortcut_continue)}\n"
+        f"force_disable_qemu={str(force_disable_qemu)}\n"
+        f"debounce_mode={bounce_mode}\n"
+        f"repeat_rate={repeat_rate}\n"
+        f"repeat_delay={int(repeat_delay*1000)}\n"
+    ).encode()
+    tmp_file = config_file + ".tmp"
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        write_all(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_file, config_file)
+
+# --------------------------------------------------------------------
+# EVENT LOG
+# --------------------------------------------------------------------
+def parse_ms_placeholder(value):
+    """
+    Ubah nilai delay/threshold dari log lama ("17 ms", "17", "", 17.0) menjadi
+    int ms, atau None bila kosong. Nilai lain dibiarkan apa adanya.
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        if text.endswith("ms"):
+            text = text[:-2].strip()
+        if not text:
+            return None
+        try:
+            return int(text)
+        except ValueError:
+            return value
+    if isinstance(value, float):
+        return int(value)
+    return value
+
+class LogEvent:
+    """
+    Satu event log (input maupun bounce). Memakai __slots__, bukan dict, agar
+    murah dibuat per keystroke dan hemat memori selama disimpan di riwayat.
+    Baru diubah menjadi dict saat diserialisasi ke file log.
+    """
+    __slots__ = ('timestamp', 'msg_id', 'placeholders')
+
+    def __init__(self, timestamp, msg_id, placeholders):
+        self.timestamp = timestamp
+        self.msg_id = msg_id
+        self.placeholders = placeholders
+
+    @classmethod
+    def from_dict(cls, d):
+        # msg_id dan nama tombol di-intern agar ribuan event hasil load_logs
+        # berbagi objek string yang sama dengan KEY_NAMES, bukan salinan per baris.
+        placeholders = d.get('placeholders', {})
+        key = placeholders.get('key')
+        if type(key) is str:
+            placeholders['key'] = sys.intern(key)
+        # Log versi lama bisa menyimpan delay/threshold sebagai "17 ms"
+        for name in ('delay', 'threshold'):
+            if name in placeholders:
+                placeholders[name] = parse_ms_placeholder(placeholders[name])
+        return cls(d.get('timestamp', 0.0), sys.intern(d.get('msg_id', '')), placeholders)
+
+    def to_dict(self):
+        return {
+            'timestamp': self.timestamp,
+            'msg_id': self.msg_id,
+            'placeholders': self.placeholders
+        }
 
 # --------------------------------------------------------------------
 # LOAD LOG
 # --------------------------------------------------------------------
-def load_logs():
-    global input_events, bounce_events
-    if os.path.exists(log_input_file):
-        with open(log_input_file, "r") as f:
-            for line in f:
-                try:
-                    evt = json.loads(line)
-                    input_events.append(evt)
-                except:
-                    pass
-    if os.path.exists(log_bounce_file):
-        with open(log_bounce_file, "r") as f:
+STATS_PRESS_IDS = {
+    'inject_down_first_global',
+    'inject_down_subsequent',
+    'inject_down_custom'
+}
+STATS_BOUNCE_IDS = {'bounce_detected'}
+
+STATS_PRESS_IDS_BYTES = tuple(m.encode() for m in STATS_PRESS_IDS)
+STATS_BOUNCE_IDS_BYTES = tuple(m.encode() for m in STATS_BOUNCE_IDS)
+
+LOG_TAIL_BLOCK = 1 << 16
+
+def find_tail_start(f, size, max_lines):
+    """
+    Cari offset byte awal dari max_lines baris terakhir dengan membaca file
+    mundur per blok, tanpa menyentuh bagian file yang lebih lama.
+    """
+    pos = size
+    count = 0
+    while pos > 0:
+        read_size = min(LOG_TAIL_BLOCK, pos)
+        pos -= read_size
+        f.seek(pos)
+        chunk = f.read(read_size)
+        end = len(chunk)
+        if pos + end == size and chunk.endswith(b"\n"):
+            end -= 1  # newline penutup baris terakhir bukan batas baris
+        newlines = chunk.count(b"\n", 0, end)
+        if count + newlines < max_lines:
+            count += newlines
+            continue
+        idx = end
+        while True:
+            idx = chunk.rfind(b"\n", 0, idx)
+            count += 1
+            if count == max_lines:
+                return pos + idx + 1
+    return 0
+
+def load_log_file(path, events, msg_ids, msg_ids_bytes, record_stats, stats_offset=0):
+    """
+    Baca satu file log. Hanya LOG_MEMORY_MAX baris terakhir (dicari dengan seek
+    dari akhir file) yang di-parse menjadi LogEvent untuk ditampilkan.
+    Statistik hanya dihitung untuk baris mulai stats_offset (posisi checkpoint
+    stats.json); baris di antara checkpoint dan awal tail cukup di-parse bila
+    memuat msg_id yang relevan. Bagian file sebelum checkpoint tidak dibaca.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        tail_start = find_tail_start(f, size, LOG_MEMORY_MAX)
+
+        if stats_offset < tail_start:
+            f.seek(stats_offset)
+            pos = stats_offset
             for line in f:
-                try:
-                    evt = json.loads(line)
-                    bounce_events.append(evt)
-                except:
-                    pass
+                if pos >= tail_start:
+                    break
+                pos += len(line)
+                if any(m in line for m in msg_ids_bytes):
+                    try:
+                        d = orjson.loads(line)
+                    except:
+                        d = None
+                    if d and d.get('msg_id') in msg_ids:
+                        record_stats(d.get('placeholders', {}).get('key', 'Unknown'))
+
+        f.seek(tail_start)
+        tail = f.read().splitlines(True)
+
+    # Baris tail yang dimulai sebelum stats_offset sudah tercakup checkpoint:
+    # tetap ditampilkan, tetapi tidak dihitung ulang ke statistik.
+    counted_from = len(tail)
+    pos = tail_start
+    for n, line in enumerate(tail):
+        if pos >= stats_offset:
+            counted_from = n
+            break
+        pos += len(line)
+    for lines, count_stats in ((tail[:counted_from], False), (tail[counted_from:], True)):
+        for d in decode_log_lines(lines):
+            try:
+                evt = LogEvent.from_dict(d)
+            except:
+                continue
+            events.append(evt)
+            if count_stats:
+                rebuild_stats_from_event(evt, msg_ids, record_stats)
 
-def rebuild_stats_from_logs():
-    press_ids = {
-        'inject_down_first_global',
-        'inject_down_subsequent',
-        'inject_down_custom'
-    }
-    bounce_ids = {'bounce_detected'}
-
-    for evt in input_events:
-        msg_id = evt.get('msg_id', '')
-        placeholders = evt.get('placeholders', {})
-        key_name = placeholders.get('key', 'Unknown')
-        if msg_id in press_ids:
-            record_stats_press(key_name)
-
-    for evt in bounce_events:
-        msg_id = evt.get('msg_id', '')
-        placeholders = evt.get('placeholders', {})
-        key_name = placeholders.get('key', 'Unknown')
-        if msg_id in bounce_ids:
-            record_stats_bounce(key_name)
+def decode_log_lines(lines):
+    """
+    Decode banyak baris JSON sekaligus: baris digabung menjadi satu array JSON
+    dan di-parse dengan satu panggilan orjson.loads. Jika ada baris rusak,
+    kembali ke parse per baris dan lewati baris yang gagal.
+    """
+    lines = [line for line in lines if not line.isspace()]
+    try:
+        return orjson.loads(b"[" + b",".join(lines) + b"]")
+    except orjson.JSONDecodeError:
+        pass
+    decoded = []
+    for line in lines:
+        try:
+            decoded.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue
+    return decoded
+
+def load_stats_checkpoint():
+    """
+    Muat stats.json (hasil save_stats_checkpoint). Mengembalikan offset byte
+    log_input/log_bounce yang sudah tercakup, atau (0, 0) jika checkpoint tidak
+    ada/tidak cocok lagi dengan file log (misal file log dihapus atau dipotong).
+    """
+    try:
+        with open(stats_file, "rb") as f:
+            checkpoint = orjson.loads(f.read())
+        offsets = []
+        for path, name in ((log_input_file, 'input'), (log_bounce_file, 'bounce')):
+            st = os.stat(path)
+            offset, inode = checkpoint[name + '_offset'], checkpoint[name + '_inode']
+            if st.st_ino != inode or st.st_size < offset:
+                return 0, 0
+            offsets.append(offset)
+        loaded = [
+            (sys.intern(k), int(v["press"]), int(v["bounce"]), float(v["time_added"]))
+            for k, v in checkpoint['stats'].items()
+        ]
+    except:
+        return 0, 0
+    clear_stats()
+    for row in loaded:
+        add_stats_key(*row)
+    return offsets[0], offsets[1]
+
+def save_stats_checkpoint():
+    """
+    Simpan statistik per tombol beserta ukuran file log saat ini, agar startup berikutnya
+    cukup menghitung event yang ditulis setelah titik ini. Dipanggil setelah
+    log_writer selesai, sehingga semua event yang sudah dihitung ada di file.
+    """
+    try:
+        st_in = os.stat(log_input_file)
+        st_bn = os.stat(log_bounce_file)
+        payload = orjson.dumps({
+            'stats': {
+                k: {"press": stats_press[i], "bounce": stats_bounce[i], "time_added": stats_time_added[i]}
+                for i, k in enumerate(stats_keys)
+            },
+            'input_offset': st_in.st_size,
+            'input_inode': st_in.st_ino,
+            'bounce_offset': st_bn.st_size,
+            'bounce_inode': st_bn.st_ino
+        })
+        tmp_file = stats_file + ".tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+        try:
+            write_all(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, stats_file)
+    except Exception as e:
+        print(f"Error saving stats checkpoint: {e}")
+
+def load_logs():
+    """
+    Baca file log. Statistik diawali dari stats.json bila ada, lalu hanya event
+    setelah checkpoint yang dihitung; hanya LOG_MEMORY_MAX event terakhir yang
+    disimpan di input_events/bounce_events.
+    """
+    input_offset, bounce_offset = load_stats_checkpoint()
+    load_log_file(log_input_file, input_events, STATS_PRESS_IDS,
+                  STATS_PRESS_IDS_BYTES, record_stats_press, input_offset)
+    load_log_file(log_bounce_file, bounce_events, STATS_BOUNCE_IDS,
+                  STATS_BOUNCE_IDS_BYTES, record_stats_bounce, bounce_offset)
+
+def rebuild_stats_from_event(evt, msg_ids, record_stats):
+    if evt.msg_id in msg_ids:
+        record_stats(evt.placeholders.get('key', 'Unknown'))
 
 def load_logs_all():
     load_logs()
-    rebuild_stats_from_logs()
 
 # --------------------------------------------------------------------
 # UI TEKS
@@ -428,6 +818,25 @@ LANG_UI = {
     }
 }
 
+# Pilihan combobox sort (urutan tampil) dan teks default-nya. Teks per bahasa
+# dibangun sekali di sini, bukan belasan lang_ui.get() setiap ganti bahasa.
+SORT_ITEM_DEFAULTS = (
+    ('time_added_asc', "Time Added (ASC)"),
+    ('time_added_desc', "Time Added (DESC)"),
+    ('key_asc', "Key (ASC)"),
+    ('key_desc', "Key (DESC)"),
+    ('press_asc', "Press Count (ASC)"),
+    ('press_desc', "Press Count (DESC)"),
+    ('bounce_asc', "Bounce Count (ASC)"),
+    ('bounce_desc', "Bounce Count (DESC)"),
+    ('percent_asc', "% Bounce (ASC)"),
+    ('percent_desc', "% Bounce (DESC)"),
+)
+SORT_ITEMS = {
+    lang: [ui.get('sorting_' + mode, default) for mode, default in SORT_ITEM_DEFAULTS]
+    for lang, ui in LANG_UI.items()
+}
+
 # Pesan log / event
 LANG_MSG = {
     'device_found': {
@@ -443,16 +852,16 @@ LANG_MSG = {
         'en': "Processing {key} DOWN"
     },
     'inject_down_subsequent': {
-        'id': "Memproses tombol {key} DOWN (delay: {delay} from previous press)",
-        'en': "Processing {key} DOWN (delay: {delay} from previous press)"
+        'id': "Memproses tombol {key} DOWN (delay: {delay} ms from previous press)",
+        'en': "Processing {key} DOWN (delay: {delay} ms from previous press)"
     },
     'inject_up': {
         'id': "Memproses tombol {key} UP",
         'en': "Processing {key} UP"
     },
     'inject_down_custom': {
-        'id': "Memproses tombol {key} DOWN (delay: {delay} from previous release)",
-        'en': "Processing {key} DOWN (delay: {delay} from previous release)"
+        'id': "Memproses tombol {key} DOWN (delay: {delay} ms from previous release)",
+        'en': "Processing {key} DOWN (delay: {delay} ms from previous release)"
     },
     'inject_up_custom': {
         'id': "Memproses tombol {key} UP",
@@ -467,8 +876,8 @@ LANG_MSG = {
         'en': "Error injecting UP for {key}: {error}"
     },
     'bounce_detected': {
-        'id': "Bounce event difilter pada {key}: jeda {delay} (< {threshold} ms)",
-        'en': "Bounce event filtered on {key}: delay {delay} (< {threshold} ms)"
+        'id': "Bounce event difilter pada {key}: jeda {delay} ms (< {threshold} ms)",
+        'en': "Bounce event filtered on {key}: delay {delay} ms (< {threshold} ms)"
     },
     'inject_down_pause': {
         'id': "Tombol {key} DOWN saat pause/akan pause",
@@ -528,178 +937,399 @@ LANG_MSG = {
     }
 }
 
+# Template pesan untuk bahasa aktif (msg_id -> template), dibangun ulang
+# hanya saat bahasa berubah agar translate_event cukup satu lookup.
+active_templates = {}
+
+DELAY_CLAUSE = " (delay: {delay} ms"
+
+def without_delay_clause(template):
+    """
+    Varian template tanpa bagian "(delay: {delay} ms ...)", dipakai bila event
+    tidak punya delay (misal tekan pertama setelah startup).
+    """
+    i = template.find(DELAY_CLAUSE)
+    if i < 0:
+        return template
+    j = template.index(")", i)
+    return template[:i] + template[j + 1:]
+
+def compile_template(template):
+    """
+    Ubah template "{key} ..." menjadi fungsi fmt(placeholders) berbasis f-string,
+    agar template tidak di-parse ulang oleh format_map setiap event. Nama field
+    dioper lewat argumen default (_f0, _f1, ...) sehingga kode hasil generate
+    hanya berisi identifier, bukan string dari template.
+    """
+    literal = []
+    fields = []
+    for text, field, spec, conv in string.Formatter().parse(template):
+        literal.append(text.replace("{", "{{").replace("}", "}}"))
+        if field is not None:
+            name = f"_f{len(fields)}"
+            fields.append(field)
+            literal.append("{ph[" + name + "]" + (f"!{conv}" if conv else "") + (f":{spec}" if spec else "") + "}")
+    args = "".join(f", {f'_f{i}'}={field!r}" for i, field in enumerate(fields))
+    return eval(f"lambda ph{args}: f{''.join(literal)!r}")
+
+UNDEFINED_TEMPLATES = (compile_template("[UNDEFINED MSG_ID]"),) * 2
+
+def build_active_templates():
+    """
+    active_templates[msg_id] = (fmt, fmt_tanpa_delay) untuk bahasa aktif;
+    keduanya fungsi hasil compile_template().
+    """
+    global active_templates
+    active_templates = {}
+    for msg_id, langs in LANG_MSG.items():
+        template = langs.get(current_language, "[UNDEFINED MSG_ID]")
+        active_templates[msg_id] = (
+            compile_template(template),
+            compile_template(without_delay_clause(template))
+        )
+
 # --------------------------------------------------------------------
 # LAINNYA: SOUND, KEY NORMALIZE, ETC
 # --------------------------------------------------------------------
-def play_sound(filename):
-    if not sound_enabled:
-        return
+def init_sound_mixer():
+    global sound_enabled, sound_mixer_ready
+    try:
+        pygame.mixer.init()
+        sound_mixer_ready = True
+    except pygame.error as e:
+        print(f"Audio device error: {e}. Efek suara dinonaktifkan.")
+        sound_enabled = False
+
+def load_sound(filename):
     sound_path = os.path.join(script_dir, filename)
     if not os.path.exists(sound_path):
         possible_sounds_dir = os.path.join(script_dir, "sounds")
         alt_path = os.path.join(possible_sounds_dir, filename)
         if os.path.exists(alt_path):
             sound_path = alt_path
+    return pygame.mixer.Sound(sound_path)
+
+def play_sound(filename):
+    # Dipanggil dari thread pemantau maupun main thread
+    if not sound_enabled:
+        return
     try:
-        snd = pygame.mixer.Sound(sound_path)
+        with sound_lock:
+            if not sound_mixer_ready:
+                init_sound_mixer()
+                if not sound_enabled:
+                    return
+            snd = sound_cache.get(filename)
+            if snd is None:
+                snd = load_sound(filename)
+                sound_cache[filename] = snd
         snd.play()
     except Exception as e:
         print(f"Error playing sound {filename}: {e}")
 
+# Dibuat sekali di level modul, bukan dibangun ulang setiap pemanggilan
+NORMALIZE_KEY_MAP = {
+    "KEY_CONTROL_L": "KEY_LEFTCTRL",
+    "KEY_CONTROL_R": "KEY_RIGHTCTRL",
+    "KEY_ALT_L": "KEY_LEFTALT",
+    "KEY_ALT_R": "KEY_RIGHTALT",
+    "KEY_SHIFT_L": "KEY_LEFTSHIFT",
+    "KEY_SHIFT_R": "KEY_RIGHTSHIFT",
+    "KEY_SCROLL_LOCK": "KEY_SCROLLLOCK"
+}
+
+MODIFIER_KEYS = frozenset({
+    "KEY_LEFTSHIFT", "KEY_RIGHTSHIFT",
+    "KEY_LEFTCTRL", "KEY_RIGHTCTRL",
+    "KEY_LEFTALT", "KEY_RIGHTALT",
+    "KEY_LEFTMETA", "KEY_RIGHTMETA",
+    "KEY_CAPSLOCK", "KEY_NUMLOCK", "KEY_SCROLLLOCK"
+})
+
 def normalize_key(key):
-    mapping = {
-        "KEY_CONTROL_L": "KEY_LEFTCTRL",
-        "KEY_CONTROL_R": "KEY_RIGHTCTRL",
-        "KEY_ALT_L": "KEY_LEFTALT",
-        "KEY_ALT_R": "KEY_RIGHTALT",
-        "KEY_SHIFT_L": "KEY_LEFTSHIFT",
-        "KEY_SHIFT_R": "KEY_RIGHTSHIFT",
-        "KEY_SCROLL_LOCK": "KEY_SCROLLLOCK"
-    }
-    return mapping.get(key, key)
+    return NORMALIZE_KEY_MAP.get(key, key)
 
 def is_modifier(key_name):
-    modifiers = {
-        "KEY_LEFTSHIFT", "KEY_RIGHTSHIFT",
-        "KEY_LEFTCTRL", "KEY_RIGHTCTRL",
-        "KEY_LEFTALT", "KEY_RIGHTALT",
-        "KEY_LEFTMETA", "KEY_RIGHTMETA",
-        "KEY_CAPSLOCK", "KEY_NUMLOCK", "KEY_SCROLLLOCK"
-    }
-    return key_name in modifiers
+    return key_name in MODIFIER_KEYS
 
 # --------------------------------------------------------------------
 # CREATE UINPUT
 # --------------------------------------------------------------------
+# Semua konstanta KEY_* milik python-uinput, diambil sekali lewat vars()
+# (tanpa sort dir() dan getattr per nama); dipakai untuk Device maupun tabel
+# keycode -> key uinput di build_key_tables().
+UINPUT_KEYS = tuple(v for n, v in vars(uinput).items() if n.startswith("KEY_"))
+
 def create_uinput_device():
-    available_keys = [getattr(uinput, attr) for attr in dir(uinput) if attr.startswith("KEY_")]
-    return uinput.Device(available_keys, name="Virtual Keyboard")
+    return uinput.Device(UINPUT_KEYS, name="Virtual Keyboard")
 
 uinput_device = create_uinput_device()
 
+def build_key_tables():
+    """
+    Bangun tabel keycode -> nama tombol (sudah dinormalisasi) dan
+    keycode -> key uinput sekali saat startup, agar loop monitor tidak perlu
+    categorize(), normalize_key(), maupun getattr(uinput, ...) per event.
+    Tabel uinput diisi dari kode di tuple (EV_KEY, code) milik uinput, bukan
+    dari nama, sehingga kode alias (mis. KEY_MUTE/KEY_MIN_INTERESTING) tetap
+    punya pasangan.
+    """
+    names = [sys.intern("0x{:02X}".format(code)) for code in range(KEY_MAX)]
+    uinput_keys = [None] * KEY_MAX
+    for code, name in ecodes.keys.items():
+        if code >= KEY_MAX:
+            continue
+        if not isinstance(name, str):
+            name = name[0]
+        names[code] = sys.intern(normalize_key(name))
+    for ukey in UINPUT_KEYS:
+        if ukey[0] == ecodes.EV_KEY and 0 <= ukey[1] < KEY_MAX:
+            uinput_keys[ukey[1]] = ukey
+    return names, uinput_keys
+
+KEY_NAMES, KEY_TO_UINPUT = build_key_tables()
+
 # --------------------------------------------------------------------
 # LOGGING & RENDER
 # --------------------------------------------------------------------
-def translate_event(evt):
+@functools.lru_cache(maxsize=64)
+def format_hms(ts_sec):
     """
-    Memformat event menjadi string tampilan log.
+    Jam "HH:MM:SS" per detik (di-cache); event yang datang beruntun dalam detik
+    yang sama tidak perlu localtime/strftime lagi. lru_cache aman dipakai
+    bersamaan oleh main thread dan thread render.
     """
-    lang = current_language
-    msg_id = evt['msg_id']
-    placeholders = evt.get('placeholders', {})
+    return time.strftime("%H:%M:%S", time.localtime(ts_sec))
 
-    # --- Normalisasi agar tidak double "ms", dan agar tidak int(None) ---
-    # delay
-    if 'delay' in placeholders:
-        old_val = placeholders['delay']
-        if old_val is not None:
-            if isinstance(old_val, str) and old_val.endswith(" ms"):
-                old_val = old_val[:-3]
-            try:
-                numeric_val = int(old_val)
-                placeholders['delay'] = f"{numeric_val} ms"
-            except:
-                placeholders['delay'] = str(old_val)
-        else:
-            placeholders['delay'] = ""
-
-    # threshold
-    if 'threshold' in placeholders:
-        old_thr = placeholders['threshold']
-        if old_thr is not None:
-            if isinstance(old_thr, str) and old_thr.endswith(" ms"):
-                old_thr = old_thr[:-3]
-            try:
-                numeric_thr = int(old_thr)
-                placeholders['threshold'] = str(numeric_thr)
-            except:
-                placeholders['threshold'] = str(old_thr)
-        else:
-            placeholders['threshold'] = ""
-
-    template = LANG_MSG.get(msg_id, {}).get(lang, "[UNDEFINED MSG_ID]")
-    rendered_text = template.format(**placeholders)
-
-    # Hapus substring jika delay kosong
-    if 'delay' in placeholders:
-        if placeholders['delay'].strip() == "":
-            rendered_text = rendered_text.replace("(delay:  from previous release)", "")
-            rendered_text = rendered_text.replace("(delay:  from previous press)", "")
-            rendered_text = " ".join(rendered_text.split())
-
-    ts_struct = time.localtime(evt['timestamp'])
-    time_str = time.strftime("%H:%M:%S", ts_struct)
-    return f"[{time_str}] {rendered_text}"
-
-def add_input_event(evt_dict):
+def translate_event(evt, templates=None):
+    """
+    Memformat event menjadi string tampilan log. templates default ke
+    active_templates (bahasa aktif).
+    """
+    if templates is None:
+        templates = active_templates
+    # Placeholder delay/threshold sudah berupa angka ms (lihat LogEvent.from_dict
+    # untuk log lama); satuan " ms" ada di template, jadi cukup satu panggilan
+    # fungsi template hasil compile_template().
+    placeholders = evt.placeholders
+    fmt, fmt_nodelay = templates.get(evt.msg_id, UNDEFINED_TEMPLATES)
+    if placeholders.get('delay', 0) is None:
+        fmt = fmt_nodelay
+    rendered_text = fmt(placeholders)
+
+    return f"[{format_hms(int(evt.timestamp))}] {rendered_text}"
+
+# Baris log yang belum dimasukkan ke widget GUI; di-flush sekaligus per
+# putaran process_event_queue (satu insert + satu scroll, bukan per event).
+pending_input_lines = []
+pending_bounce_lines = []
+# Batas jumlah baris di widget log; baris tertua dibuang agar widget Text
+# tidak terus membesar selama program berjalan berjam-jam.
+LOG_WIDGET_MAX_LINES = 5000
+# Widget log yang tabnya sedang terlihat (None jika tab lain). Event untuk tab
+# yang tersembunyi tidak diterjemahkan; cukup dihitung, lalu event terakhirnya
+# diterjemahkan sekaligus saat tab itu dibuka (catch_up_log_widget).
+visible_log_widget = None
+unrendered_input_count = 0
+unrendered_bounce_count = 0
+
+def add_input_event(evt):
     """
-    Tambahkan event ke input_events (list) + tampilkan di GUI jika ada + tulis ke file log_input.
+    Tambahkan event ke input_events + antre untuk GUI jika ada + antre untuk ditulis ke log_input.
     """
-    input_events.append(evt_dict)
+    global unrendered_input_count
+    input_events.append(evt)
+    # Tetap tulis ke file, baik GUI maupun non-GUI (lewat log_writer_thread).
+    # Diserialisasi sekali di sini; writer hanya menulis bytes-nya.
+    log_queue.put(('input', orjson.dumps(evt.to_dict(), option=orjson.OPT_APPEND_NEWLINE)))
     if use_gui:
         if input_text:
-            input_text.configure(state='normal')
-            line = translate_event(evt_dict) + "\n"
-            input_text.insert(tk.END, line)
-            input_text.configure(state='disabled')
-            input_text.yview_moveto(1.0)
-
-    # Tetap tulis ke file, baik GUI maupun non-GUI
-    with open(log_input_file, "a") as f:
-        f.write(json.dumps(evt_dict) + "\n")
+            if visible_log_widget is input_text:
+                pending_input_lines.append(translate_event(evt) + "\n")
+            else:
+                unrendered_input_count += 1
 
-def add_bounce_event(evt_dict):
+def add_bounce_event(evt):
     """
-    Tambahkan event ke bounce_events (list) + tampilkan di GUI jika ada + tulis ke file log_bounce.
+    Tambahkan event ke bounce_events + antre untuk GUI jika ada + antre untuk ditulis ke log_bounce.
     """
-    bounce_events.append(evt_dict)
+    global unrendered_bounce_count
+    bounce_events.append(evt)
+    # Tetap tulis ke file, baik GUI maupun non-GUI (lewat log_writer_thread).
+    # Diserialisasi sekali di sini; writer hanya menulis bytes-nya.
+    log_queue.put(('bounce', orjson.dumps(evt.to_dict(), option=orjson.OPT_APPEND_NEWLINE)))
     if use_gui:
         if bounce_text:
-            bounce_text.configure(state='normal')
-            line = translate_event(evt_dict) + "\n"
-            bounce_text.insert(tk.END, line)
-            bounce_text.configure(state='disabled')
-            bounce_text.yview_moveto(1.0)
+            if visible_log_widget is bounce_text:
+                pending_bounce_lines.append(translate_event(evt) + "\n")
+            else:
+                unrendered_bounce_count += 1
+
+def flush_log_widget(widget, pending_lines):
+    if not pending_lines:
+        return
+    widget.configure(state='normal')
+    widget.insert(tk.END, "".join(pending_lines))
+    line_count = int(widget.index('end-1c').split('.')[0])
+    if line_count > LOG_WIDGET_MAX_LINES:
+        widget.delete("1.0", f"end-{LOG_WIDGET_MAX_LINES + 1}l")
+    widget.configure(state='disabled')
+    widget.yview_moveto(1.0)
+    pending_lines.clear()
+
+def catch_up_log_widget(widget):
+    """
+    Dipanggil saat tab log dibuka: terjemahkan event yang terlewat selama tab
+    tersembunyi (maksimal LOG_WIDGET_MAX_LINES terakhir) lalu flush.
+    """
+    global visible_log_widget, unrendered_input_count, unrendered_bounce_count
+    visible_log_widget = widget
+    if widget is None:
+        return
+    if widget is input_text:
+        events, pending_lines, count = input_events, pending_input_lines, unrendered_input_count
+        unrendered_input_count = 0
+    else:
+        events, pending_lines, count = bounce_events, pending_bounce_lines, unrendered_bounce_count
+        unrendered_bounce_count = 0
+    count = min(count, len(events), LOG_WIDGET_MAX_LINES)
+    if count:
+        pending_lines.extend(
+            translate_event(evt) + "\n"
+            for evt in itertools.islice(events, len(events) - count, None)
+        )
+    flush_gui_logs()
 
-    # Tetap tulis ke file, baik GUI maupun non-GUI
-    with open(log_bounce_file, "a") as f:
-        f.write(json.dumps(evt_dict) + "\n")
+def flush_gui_logs():
+    # Selama render ulang (render_all_logs) belum selesai, baris baru ditahan
+    # dulu agar tidak terhapus saat hasil render dipasang ke widget.
+    if use_gui and _rendered_token == _render_token:
+        if input_text:
+            flush_log_widget(input_text, pending_input_lines)
+        if bounce_text:
+            flush_log_widget(bounce_text, pending_bounce_lines)
+
+# --------------------------------------------------------------------
+# LOG WRITER (thread)
+# --------------------------------------------------------------------
+# Event log tidak lagi ditulis dengan open-append-close per event. Event
+# dikumpulkan di log_queue lalu ditulis berkelompok (group commit) oleh satu
+# thread: satu write(2) per batch, paling sering tiap LOG_FLUSH_INTERVAL.
+LOG_BATCH_MAX = 256
+LOG_FLUSH_INTERVAL = 0.25  # detik
+
+log_queue = queue.SimpleQueue()
+log_writer = None
+
+LOG_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC
+
+def log_writer_thread():
+    # fd dibuka sekali dengan O_APPEND; satu batch = satu write(2) per file,
+    # tanpa lapisan buffer Python dan tanpa open/close per event.
+    fds = {
+        'input': os.open(log_input_file, LOG_OPEN_FLAGS, 0o644),
+        'bounce': os.open(log_bounce_file, LOG_OPEN_FLAGS, 0o644),
+    }
+    running = True
+    while running:
+        # Tunggu event pertama, lalu kumpulkan event lain yang datang
+        # dalam jendela LOG_FLUSH_INTERVAL (atau sampai LOG_BATCH_MAX).
+        batch = [log_queue.get()]
+        deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+        while len(batch) < LOG_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(log_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        lines = {'input': [], 'bounce': []}
+        for item in batch:
+            if item is None:  # sinyal berhenti dari stop_log_writer()
+                running = False
+                continue
+            target, raw = item
+            lines[target].append(raw)
+
+        for target, chunk in lines.items():
+            if chunk:
+                write_all(fds[target], b"".join(chunk))
+
+    for fd in fds.values():
+        os.close(fd)
+
+def start_log_writer():
+    global log_writer
+    log_writer = threading.Thread(target=log_writer_thread, daemon=True)
+    log_writer.start()
+
+def stop_log_writer():
+    """
+    Dipanggil saat keluar: pastikan sisa event di log_queue tertulis ke file,
+    lalu simpan checkpoint statistik.
+    """
+    if log_writer is not None and log_writer.is_alive():
+        log_queue.put(None)
+        log_writer.join(timeout=2)
+        if not log_writer.is_alive():
+            save_stats_checkpoint()
+
+atexit.register(stop_log_writer)
 
 # --------------------------------------------------------------------
 # Fungsi-fungsi "enqueue" (dipanggil dari thread pemantau)
 # --------------------------------------------------------------------
-event_queue = queue.Queue()
+# deque: append/popleft atomik di bawah GIL, tanpa Lock + Condition per item
+# seperti queue.Queue. event_queue_ready membangunkan konsumen (mode --nogui)
+# dan hanya di-set bila belum set, jadi put biasa tidak menyentuh lock.
+# Sengaja tanpa maxlen: semua pesan (log, stats, rendered_logs, status) lewat
+# deque ini, dan membuang item tertua berarti log/stats hilang atau GUI
+# berhenti flush. Teks untuk widget sudah dibatasi di sisi GUI
+# (LOG_WIDGET_MAX_LINES).
+event_queue = collections.deque()
+event_queue_ready = threading.Event()
+
+def post_event(item):
+    event_queue.append(item)
+    if not event_queue_ready.is_set():
+        event_queue_ready.set()
+
+def set_keyboard_grabbed(grabbed):
+    """
+    Ubah status grab; GUI diberi tahu lewat event_queue hanya saat status
+    benar-benar berubah (tidak ada polling indikator).
+    """
+    global global_keyboard_grabbed
+    if grabbed != global_keyboard_grabbed:
+        global_keyboard_grabbed = grabbed
+        post_event(("status_changed", grabbed))
 
 def queue_input_event(msg_id, placeholders=None):
     if placeholders is None:
         placeholders = {}
-    evt = {
-        'timestamp': time.time(),
-        'msg_id': msg_id,
-        'placeholders': placeholders
-    }
-    event_queue.put(("input_event", evt))
+    post_event(("input_event", LogEvent(time.time(), msg_id, placeholders)))
 
 def queue_bounce_event(msg_id, placeholders=None):
     if placeholders is None:
         placeholders = {}
-    evt = {
-        'timestamp': time.time(),
-        'msg_id': msg_id,
-        'placeholders': placeholders
-    }
-    event_queue.put(("bounce_event", evt))
+    post_event(("bounce_event", LogEvent(time.time(), msg_id, placeholders)))
 
 def queue_stats_press(key_name):
-    event_queue.put(("stats_press", key_name))
+    post_event(("stats_press", key_name))
 
 def queue_stats_bounce(key_name):
-    event_queue.put(("stats_bounce", key_name))
+    post_event(("stats_bounce", key_name))
 
 # --------------------------------------------------------------------
 # Proses event_queue di main thread
 # --------------------------------------------------------------------
 _stats_update_scheduled = False
+# Tab statistik adalah tab pertama, jadi terlihat saat startup. Selama tab lain
+# yang dipilih, perubahan hanya terkumpul di stats_dirty_keys dan baru
+# diterapkan ke Treeview saat tab statistik dibuka lagi (on_tab_changed).
+stats_tab_visible = True
 
 def schedule_stats_render():
     """
@@ -707,6 +1337,8 @@ def schedule_stats_render():
     kita jadwalkan rendering secara terjadwal.
     """
     global _stats_update_scheduled
+    if not stats_tab_visible:
+        return
     if not _stats_update_scheduled:
         _stats_update_scheduled = True
         if use_gui:
@@ -715,32 +1347,48 @@ def schedule_stats_render():
 def do_render_stats_table():
     global _stats_update_scheduled
     _stats_update_scheduled = False
-    render_stats_table()
+    update_stats_rows()
 
-def process_event_queue():
+def process_event_queue(wait_timeout=None):
     """
     Ambil semua item di event_queue, proses (update log, stats, dll.).
     Pada mode GUI, fungsi ini akan dipanggil berulang via root.after().
-    Pada mode --nogui, kita panggil manual dalam loop.
+    Pada mode --nogui, kita panggil manual dalam loop dengan wait_timeout:
+    tunggu (blocking) sampai item pertama datang, lalu kuras semuanya.
     """
-    while True:
-        try:
-            item_type, data = event_queue.get_nowait()
-        except queue.Empty:
-            break
-
+    stats_changed = False
+    if wait_timeout is not None:
+        if not event_queue_ready.wait(wait_timeout):
+            return
+    # clear() sebelum menguras: event yang masuk setelah ini akan set() lagi
+    event_queue_ready.clear()
+
+    popleft = event_queue.popleft
+    while event_queue:
+        item_type, data = popleft()
         if item_type == "input_event":
             add_input_event(data)
-            schedule_stats_render()
+            stats_changed = True
         elif item_type == "bounce_event":
             add_bounce_event(data)
-            schedule_stats_render()
+            stats_changed = True
         elif item_type == "stats_press":
             record_stats_press(data)
-            schedule_stats_render()
+            stats_changed = True
         elif item_type == "stats_bounce":
             record_stats_bounce(data)
-            schedule_stats_render()
+            stats_changed = True
+        elif item_type == "rendered_logs":
+            apply_rendered_logs(*data)
+
+        elif item_type == "status_changed":
+            if use_gui:
+                update_status_indicator()
+
+    # Satu penjadwalan render statistik per batch, bukan per item
+    if stats_changed:
+        schedule_stats_render()
+    flush_gui_logs()
 
     if use_gui:
         # Dijadwalkan loop lagi dalam GUI
@@ -749,59 +1397,128 @@ def process_event_queue():
 # --------------------------------------------------------------------
 # render_all_logs & update UI (setelah load)
 # --------------------------------------------------------------------
+# Render ulang log (startup & ganti bahasa) diterjemahkan di thread terpisah.
+# Setiap permintaan render mendapat token; hasil yang token-nya sudah basi
+# (ada render yang lebih baru) dibuang.
+_render_token = 0
+_rendered_token = 0
+
 def render_all_logs():
+    global _render_token, unrendered_input_count, unrendered_bounce_count
     if use_gui:
-        if input_text:
-            input_text.configure(state='normal')
-            input_text.delete("1.0", tk.END)
-            for evt in input_events:
-                input_text.insert(tk.END, translate_event(evt) + "\n")
-            input_text.configure(state='disabled')
-            input_text.yview_moveto(1.0)
-
-        if bounce_text:
-            bounce_text.configure(state='normal')
-            bounce_text.delete("1.0", tk.END)
-            for evt in bounce_events:
-                bounce_text.insert(tk.END, translate_event(evt) + "\n")
-            bounce_text.configure(state='disabled')
-            bounce_text.yview_moveto(1.0)
+        # Semua event (termasuk yang masih pending) dirender ulang dari awal
+        pending_input_lines.clear()
+        pending_bounce_lines.clear()
+        unrendered_input_count = 0
+        unrendered_bounce_count = 0
+        _render_token += 1
+        start_in = max(0, len(input_events) - LOG_WIDGET_MAX_LINES)
+        start_bn = max(0, len(bounce_events) - LOG_WIDGET_MAX_LINES)
+        threading.Thread(
+            target=render_logs_worker,
+            args=(_render_token, active_templates,
+                  list(itertools.islice(input_events, start_in, None)),
+                  list(itertools.islice(bounce_events, start_bn, None))),
+            daemon=True
+        ).start()
     update_ui_language()
 
+def render_logs_worker(token, templates, input_snapshot, bounce_snapshot):
+    """
+    Terjemahkan snapshot event menjadi satu string per widget, lalu kirim ke
+    main thread lewat event_queue (Tk hanya disentuh di main thread).
+    """
+    input_buf = "".join([translate_event(evt, templates) + "\n" for evt in input_snapshot])
+    bounce_buf = "".join([translate_event(evt, templates) + "\n" for evt in bounce_snapshot])
+    post_event(("rendered_logs", (token, input_buf, bounce_buf)))
+
+def apply_rendered_logs(token, input_buf, bounce_buf):
+    global _rendered_token
+    if token != _render_token:
+        return
+    _rendered_token = token
+    for widget, buf in ((input_text, input_buf), (bounce_text, bounce_buf)):
+        if widget:
+            widget.configure(state='normal')
+            widget.delete("1.0", tk.END)
+            widget.insert("1.0", buf)
+            widget.configure(state='disabled')
+            widget.yview_moveto(1.0)
+
+# Tombol yang statistiknya berubah sejak render terakhir; diproses
+# update_stats_rows() sehingga hanya baris itu yang diperbarui di Treeview.
+stats_dirty_keys = set()
+
 def update_stats_row(key):
-    if use_gui:
-        pass  # cukup panggil schedule_stats_render() nanti
+    stats_dirty_keys.add(key)
 
 # --------------------------------------------------------------------
 # REPEAT THREAD
 # --------------------------------------------------------------------
-repeat_threads = {}
-
-def repeat_thread_func(key, stop_event):
-    time.sleep(repeat_delay)
-    interval = 1.0 / repeat_rate
-    while not stop_event.is_set():
-        try:
-            uinput_device.emit(getattr(uinput, key), 1)
-            uinput_device.emit(getattr(uinput, key), 0)
-        except Exception as e:
-            queue_input_event('inject_down_error', {'key': key, 'error': str(e)})
-        time.sleep(interval)
-
-def start_repeat(key):
+# Satu thread penjadwal untuk semua tombol yang ditahan (bukan satu thread per
+# tombol). repeat_heap berisi (deadline, seq, key) terurut waktu; repeat_active
+# memetakan key -> (seq, ukey, interval). Entri heap yang seq-nya tidak cocok
+# lagi (tombol sudah dilepas / ditekan ulang) dibuang saat muncul di puncak.
+repeat_heap = []
+repeat_active = {}
+repeat_cv = threading.Condition()
+repeat_seq = itertools.count()
+repeat_worker = None
+
+def repeat_thread_func():
+    emit = uinput_device.emit
+    monotonic = time.monotonic
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    with repeat_cv:
+        while True:
+            if not repeat_heap:
+                repeat_cv.wait()
+                continue
+            deadline, seq, key = repeat_heap[0]
+            entry = repeat_active.get(key)
+            if entry is None or entry[0] != seq:
+                heappop(repeat_heap)
+                continue
+            now = monotonic()
+            if deadline > now:
+                repeat_cv.wait(deadline - now)
+                continue
+            heappop(repeat_heap)
+            _, ukey, interval = entry
+            # Jika tertinggal jauh (misal setelah suspend), jangan kejar ketinggalan
+            next_deadline = deadline + interval
+            if next_deadline < now:
+                next_deadline = now + interval
+            heappush(repeat_heap, (next_deadline, seq, key))
+
+            repeat_cv.release()
+            try:
+                emit(ukey, 1)
+                emit(ukey, 0)
+            except Exception as e:
+                queue_input_event('inject_down_error', {'key': key, 'error': str(e)})
+            finally:
+                repeat_cv.acquire()
+
+def start_repeat(key, code):
+    global repeat_worker
     if is_modifier(key):
         return
-    if key not in repeat_threads:
-        stop_event = threading.Event()
-        t = threading.Thread(target=repeat_thread_func, args=(key, stop_event), daemon=True)
-        repeat_threads[key] = (t, stop_event)
-        t.start()
+    with repeat_cv:
+        if key in repeat_active:
+            return
+        seq = next(repeat_seq)
+        repeat_active[key] = (seq, KEY_TO_UINPUT[code], 1.0 / repeat_rate)
+        heapq.heappush(repeat_heap, (time.monotonic() + repeat_delay, seq, key))
+        if repeat_worker is None:
+            repeat_worker = threading.Thread(target=repeat_thread_func, daemon=True)
+            repeat_worker.start()
+        repeat_cv.notify()
 
 def stop_repeat(key):
-    if key in repeat_threads:
-        t, stop_event = repeat_threads[key]
-        stop_event.set()
-        del repeat_threads[key]
+    with repeat_cv:
+        repeat_active.pop(key, None)
 
 # --------------------------------------------------------------------
 # CUSTOM THRESHOLD
@@ -813,28 +1530,49 @@ def update_custom_threshold(key, threshold_ms):
     try:
         threshold = float(threshold_ms) / 1000.0
         custom_thresholds[key] = threshold
+        refresh_thresholds_ns()
         save_custom_thresholds()
         render_custom_thresholds()
         queue_input_event('custom_threshold_added', {'key': key, 'threshold': int(threshold_ms)})
     except Exception as e:
         print(f"Error updating custom threshold: {e}")
 
+# Nilai baris yang sedang tampil di custom_tree (iid -> values), agar render
+# cukup menerapkan selisihnya terhadap custom_thresholds.
+custom_tree_rows = {}
+
 def render_custom_thresholds():
+    """
+    Samakan isi custom_tree dengan custom_thresholds: hapus baris yang sudah
+    tidak ada, perbarui yang nilainya berubah, sisipkan yang baru (urutan
+    tetap urutan dict). Kolom hanya dikonfigurasi ulang jika header berubah.
+    """
     if use_gui and custom_tree:
         headers = ("Tombol", "Batas (ms)") if current_language=='id' else ("Key", "Threshold (ms)")
-        custom_tree["columns"] = headers
-        for col in headers:
-            custom_tree.heading(col, text=col)
-        total_width = custom_tree.winfo_width()
-        if total_width <= 0:
-            total_width = 240
-        col_width = int(total_width * 0.99) // len(headers)
-        for col in headers:
-            custom_tree.column(col, width=col_width, minwidth=col_width, anchor="center", stretch=True)
-        for item in custom_tree.get_children():
-            custom_tree.delete(item)
-        for kk, thr in custom_thresholds.items():
-            custom_tree.insert("", tk.END, iid=kk, values=(kk, int(thr*1000)))
+        if tuple(custom_tree["columns"]) != headers:
+            custom_tree["columns"] = headers
+            for col in headers:
+                custom_tree.heading(col, text=col)
+            total_width = custom_tree.winfo_width()
+            if total_width <= 0:
+                total_width = 240
+            col_width = int(total_width * 0.99) // len(headers)
+            for col in headers:
+                custom_tree.column(col, width=col_width, minwidth=col_width, anchor="center", stretch=True)
+
+        rows = {kk: (kk, int(thr*1000)) for kk, thr in custom_thresholds.items()}
+        stale = [kk for kk in custom_tree_rows if kk not in rows]
+        if stale:
+            custom_tree.delete(*stale)
+            for kk in stale:
+                del custom_tree_rows[kk]
+        for kk, values in rows.items():
+            shown = custom_tree_rows.get(kk)
+            if shown is None:
+                custom_tree.insert("", tk.END, iid=kk, values=values)
+            elif shown != values:
+                custom_tree.item(kk, values=values)
+            custom_tree_rows[kk] = values
 
 def delete_custom_threshold():
     if not use_gui or not custom_tree:
@@ -844,6 +1582,7 @@ def delete_custom_threshold():
         key = selected[0]
         if key in custom_thresholds:
             del custom_thresholds[key]
+            refresh_thresholds_ns()
             save_custom_thresholds()
             render_custom_thresholds()
             queue_input_event('custom_threshold_deleted', {'key': key})
@@ -883,6 +1622,7 @@ def update_pause_shortcuts(pause_key, continue_key):
     global shortcut_pause, shortcut_continue
     shortcut_pause = normalize_key(pause_key)
     shortcut_continue = normalize_key(continue_key)
+    refresh_shortcut_keys()
     save_config()
     update_ui_language()
 
@@ -906,29 +1646,52 @@ def detect_pause_key(entry):
     entry.bind("<Key>", on_key)
 
 def manual_pause_action():
-    global paused, global_keyboard_grabbed, forced_pause
+    global paused, forced_pause
     if not paused:
         paused = True
         forced_pause = False
-        global_keyboard_grabbed = False
+        set_keyboard_grabbed(False)
         play_sound("pause.wav")
         queue_input_event('manual_pause', {'key': shortcut_pause if shortcut_pause else "KEY_PAUSE"})
 
 def manual_continue_action():
-    global paused, global_keyboard_grabbed
+    global paused
     if paused:
         paused = False
         if not is_qemu_kvm_active():
-            global_keyboard_grabbed = True
+            set_keyboard_grabbed(True)
             play_sound("continue.wav")
         else:
-            global_keyboard_grabbed = False
+            set_keyboard_grabbed(False)
             play_sound("pause.wav")
         queue_input_event('manual_continue', {'key': shortcut_continue if shortcut_continue else "KEY_SCROLLLOCK"})
 
 # --------------------------------------------------------------------
 # ADVANCED SETTINGS
 # --------------------------------------------------------------------
+# Perubahan setting beruntun (mis. mode deteksi diganti bolak-balik) digabung
+# jadi satu save_config setelah CONFIG_SAVE_DELAY_MS; yang masih tertunda
+# saat aplikasi ditutup disimpan oleh handler atexit.
+CONFIG_SAVE_DELAY_MS = 500
+_config_save_after_id = None
+
+def schedule_save_config():
+    global _config_save_after_id
+    if _config_save_after_id is not None:
+        root.after_cancel(_config_save_after_id)
+    _config_save_after_id = root.after(CONFIG_SAVE_DELAY_MS, run_scheduled_save_config)
+
+def run_scheduled_save_config():
+    global _config_save_after_id
+    _config_save_after_id = None
+    save_config()
+
+def flush_scheduled_save_config():
+    if _config_save_after_id is not None:
+        run_scheduled_save_config()
+
+atexit.register(flush_scheduled_save_config)
+
 def update_force_disable_qemu():
     global force_disable_qemu
     force_disable_qemu = force_disable_qemu_var.get()
@@ -952,12 +1715,37 @@ def apply_repeat_settings():
 # --------------------------------------------------------------------
 # STATISTICS SORTING
 # --------------------------------------------------------------------
-stats_sort_mode = "time_added_asc"
+# Teks pilihan combobox (ID & EN) -> kunci mode sort. Dibuat sekali saat
+# startup, bukan dict literal baru setiap render.
+SORT_TEXT_TO_KEY = {
+    # ID
+    "Waktu Ditambahkan (ASC)": "time_added_asc",
+    "Waktu Ditambahkan (DESC)": "time_added_desc",
+    "KEY (ASC)": "key_asc",
+    "KEY (DESC)": "key_desc",
+    "Jumlah Tekan (ASC)": "press_asc",
+    "Jumlah Tekan (DESC)": "press_desc",
+    "Jumlah Bounce (ASC)": "bounce_asc",
+    "Jumlah Bounce (DESC)": "bounce_desc",
+    "% Bounce (ASC)": "percent_asc",
+    "% Bounce (DESC)": "percent_desc",
+    # EN
+    "Time Added (ASC)": "time_added_asc",
+    "Time Added (DESC)": "time_added_desc",
+    "Key (ASC)": "key_asc",
+    "Key (DESC)": "key_desc",
+    "Press Count (ASC)": "press_asc",
+    "Press Count (DESC)": "press_desc",
+    "Bounce Count (ASC)": "bounce_asc",
+    "Bounce Count (DESC)": "bounce_desc",
+    "% Bounce (ASC)": "percent_asc",
+    "% Bounce (DESC)": "percent_desc",
+}
 
-def calc_stats_percent(press, bounce):
-    if press == 0:
-        return 0.0
-    return (bounce / press) * 100.0
+# stats_sort_mode disimpan dalam bentuk kunci (mis. "press_desc"), dan
+# stats_sort_cached = (kolom, reverse) hasil parse_sort_mode-nya. Keduanya hanya
+# diubah saat pilihan combobox berubah, jadi render cukup membaca tuple ini.
+stats_sort_mode = "time_added_asc"
 
 def parse_sort_mode(mode_str):
     parts = mode_str.split("_")
@@ -976,12 +1764,78 @@ def parse_sort_mode(mode_str):
     rev = (parts[-1] == "desc")
     return col, rev
 
+stats_sort_cached = parse_sort_mode(stats_sort_mode)
+# Id root.after render sort yang masih menunggu; pilihan beruntun (mis. panah
+# atas/bawah di combobox) digabung menjadi satu render.
+_sort_render_after_id = None
+
 def on_stats_sort_changed(event=None):
-    global stats_sort_mode
-    stats_sort_mode = stats_sort_combobox.get()
-    render_stats_table()
+    global _sort_render_after_id
+    if _sort_render_after_id is not None:
+        root.after_cancel(_sort_render_after_id)
+    _sort_render_after_id = root.after(80, apply_stats_sort)
+
+def apply_stats_sort():
+    # Mode sort baru diterapkan bersamaan dengan penyusunan ulang baris, supaya
+    # update_stats_rows() di sela-sela jeda tidak memakai mode baru terhadap
+    # urutan baris yang masih milik mode lama.
+    global stats_sort_mode, stats_sort_cached, _sort_render_after_id
+    _sort_render_after_id = None
+    stats_sort_mode = convert_sort_text_to_key(stats_sort_combobox.get())
+    stats_sort_cached = parse_sort_mode(stats_sort_mode)
+    reorder_stats_table()
+
+# Kolom yang urutannya bergantung pada nilai; hanya di mode ini posisi baris
+# bisa berubah saat press/bounce bertambah.
+STATS_VALUE_SORT_COLUMNS = ("press", "bounce", "percent")
+
+# Urutan tampilan untuk mode sort berdasarkan nilai: list tuple (nilai, indeks)
+# yang selalu terurut, plus tuple terakhir per indeks. Satu tombol yang berubah
+# cukup dicabut dan disisipkan ulang dengan bisect (O(log N) pencarian),
+# tanpa mengurutkan ulang semua tombol.
+stats_order_sortkeys = []
+stats_sortkey_of = {}  # indeks -> tuple yang sedang ada di stats_order_sortkeys
+
+def stats_row_values(idx):
+    # Teks persen hanya diformat ulang setelah press/bounce tombol itu berubah;
+    # render penuh (ganti sort/bahasa) memakai ulang teks tombol yang diam.
+    pct_text = stats_percent_text[idx]
+    if pct_text is None:
+        pct_text = stats_percent_text[idx] = f"{stats_percent[idx]:.1f}%"
+    return (stats_keys[idx], stats_press[idx], stats_bounce[idx], pct_text)
+
+def stats_sort_column(col_key):
+    if col_key == "key":
+        return stats_keys
+    if col_key == "press":
+        return stats_press
+    if col_key == "bounce":
+        return stats_bounce
+    if col_key == "percent":
+        return stats_percent
+    return stats_time_added
+
+def stats_sortkey(column, idx, reverse):
+    # Tie-break dengan indeks agar urutannya sama dengan sorted() yang stabil,
+    # baik ASC maupun DESC.
+    value = column[idx]
+    return (-value if reverse else value, idx)
+
+def sorted_stats_indices():
+    """
+    Urutan indeks tombol sesuai mode sort aktif. Sort stabil terhadap urutan
+    indeks (urutan tombol pertama kali muncul), sama seperti sebelumnya.
+    """
+    col_key, reverse = stats_sort_cached
+    column = stats_sort_column(col_key)
+    return col_key, sorted(range(len(stats_keys)), key=column.__getitem__, reverse=reverse)
 
 def render_stats_table(preserve_scroll=False):
+    """
+    Bangun ulang seluruh isi Treeview statistik (saat startup dan ganti
+    bahasa). Ganti sort memakai reorder_stats_table(), update rutin per
+    event memakai update_stats_rows().
+    """
     if not use_gui or not stats_tree:
         return
 
@@ -990,107 +1844,197 @@ def render_stats_table(preserve_scroll=False):
     else:
         yview = (0.0,)
 
-    for item in stats_tree.get_children():
-        stats_tree.delete(item)
-
-    data_rows = []
-    for k, v in stats_data.items():
-        press = v["press"]
-        bnc = v["bounce"]
-        pct = calc_stats_percent(press, bnc)
-        tadd = v.get("time_added", 0.0)
-        data_rows.append((k, press, bnc, pct, tadd))
-
-    col_key, reverse = parse_sort_mode(convert_sort_text_to_key(stats_sort_mode))
-    if col_key == "time":
-        data_rows.sort(key=lambda x: x[4], reverse=reverse)
-    elif col_key == "key":
-        data_rows.sort(key=lambda x: x[0], reverse=reverse)
-    elif col_key == "press":
-        data_rows.sort(key=lambda x: x[1], reverse=reverse)
-    elif col_key == "bounce":
-        data_rows.sort(key=lambda x: x[2], reverse=reverse)
-    elif col_key == "percent":
-        data_rows.sort(key=lambda x: x[3], reverse=reverse)
-
-    for row in data_rows:
-        key_str = row[0]
-        press_val = row[1]
-        bounce_val = row[2]
-        pct_val = f"{row[3]:.1f}%"
-        stats_tree.insert("", tk.END, iid=key_str, values=(key_str, press_val, bounce_val, pct_val))
+    stats_dirty_keys.clear()
+    children = stats_tree.get_children()
+    if children:
+        stats_tree.delete(*children)
+
+    col_key, order = sorted_stats_indices()
+    for idx in order:
+        stats_tree.insert("", tk.END, iid=stats_keys[idx], values=stats_row_values(idx))
 
+    rebuild_stats_sortkeys(col_key, order)
     stats_tree.yview_moveto(yview[0])
 
+def reorder_stats_table():
+    """
+    Ganti sort: baris yang sudah ada cukup disusun ulang dengan satu
+    set_children (tanpa delete+insert), nilai selnya tidak disentuh. Hanya
+    tombol di stats_dirty_keys yang diperbarui/disisipkan lebih dulu.
+    """
+    if not use_gui or not stats_tree:
+        return
+
+    for k in stats_dirty_keys:
+        values = stats_row_values(stats_index[k])
+        if stats_tree.exists(k):
+            stats_tree.item(k, values=values)
+        else:
+            stats_tree.insert("", tk.END, iid=k, values=values)
+    stats_dirty_keys.clear()
+    if len(stats_tree.get_children()) != len(stats_keys):
+        render_stats_table()
+        return
+
+    col_key, order = sorted_stats_indices()
+    stats_tree.set_children("", *[stats_keys[idx] for idx in order])
+    rebuild_stats_sortkeys(col_key, order)
+    stats_tree.yview_moveto(0.0)
+
+def rebuild_stats_sortkeys(col_key, order):
+    # Sort key per baris (urutan tampil) untuk bisect di update_stats_rows()
+    stats_order_sortkeys.clear()
+    stats_sortkey_of.clear()
+    if col_key in STATS_VALUE_SORT_COLUMNS:
+        _, reverse = stats_sort_cached
+        column = stats_sort_column(col_key)
+        for idx in order:
+            sk = stats_sortkey(column, idx, reverse)
+            stats_order_sortkeys.append(sk)
+            stats_sortkey_of[idx] = sk
+
+def update_stats_rows():
+    """
+    Perbarui hanya baris tombol di stats_dirty_keys lewat stats_tree.item().
+    Bila urutan bergantung pada nilai (press/bounce/percent), hanya baris yang
+    berubah yang dicari posisi barunya (bisect) lalu dipindah dengan
+    stats_tree.move(). Tombol baru disisipkan langsung di posisinya, tanpa
+    menghapus & membuat ulang baris lain.
+    """
+    if not use_gui or not stats_tree or not stats_dirty_keys:
+        return
+
+    col_key, reverse = stats_sort_cached
+    reorder = col_key in STATS_VALUE_SORT_COLUMNS
+    if reorder:
+        column = stats_sort_column(col_key)
+    new_indices = []
+    for k in stats_dirty_keys:
+        idx = stats_index[k]
+        if not stats_tree.exists(k):
+            new_indices.append(idx)
+            continue
+        stats_tree.item(k, values=stats_row_values(idx))
+        if not reorder:
+            continue
+        old_sk = stats_sortkey_of[idx]
+        new_sk = stats_sortkey(column, idx, reverse)
+        if new_sk == old_sk:
+            continue
+        del stats_order_sortkeys[bisect.bisect_left(stats_order_sortkeys, old_sk)]
+        pos = bisect.bisect_left(stats_order_sortkeys, new_sk)
+        stats_order_sortkeys.insert(pos, new_sk)
+        stats_sortkey_of[idx] = new_sk
+        stats_tree.move(k, "", pos)
+    stats_dirty_keys.clear()
+
+    if new_indices:
+        insert_new_stats_rows(new_indices, column if reorder else None, reverse)
+
+def insert_new_stats_rows(new_indices, column, reverse):
+    """
+    Sisipkan baris untuk tombol yang baru muncul. column berisi kolom sort
+    bila mode sort berdasarkan nilai (posisi lewat bisect), atau None untuk
+    sort key/time: posisinya diambil dari urutan lengkap, dan baris disisipkan
+    dari posisi terkecil agar setiap indeks tujuan sudah valid saat dipakai.
+    """
+    if column is not None:
+        for idx in new_indices:
+            sk = stats_sortkey(column, idx, reverse)
+            pos = bisect.bisect_left(stats_order_sortkeys, sk)
+            stats_order_sortkeys.insert(pos, sk)
+            stats_sortkey_of[idx] = sk
+            stats_tree.insert("", pos, iid=stats_keys[idx], values=stats_row_values(idx))
+        return
+
+    position = {idx: pos for pos, idx in enumerate(sorted_stats_indices()[1])}
+    new_indices.sort(key=position.__getitem__)
+    for idx in new_indices:
+        stats_tree.insert("", position[idx], iid=stats_keys[idx], values=stats_row_values(idx))
+
 def convert_sort_text_to_key(text):
-    mapping_text_to_key = {
-        # ID
-        "Waktu Ditambahkan (ASC)": "time_added_asc",
-        "Waktu Ditambahkan (DESC)": "time_added_desc",
-        "KEY (ASC)": "key_asc",
-        "KEY (DESC)": "key_desc",
-        "Jumlah Tekan (ASC)": "press_asc",
-        "Jumlah Tekan (DESC)": "press_desc",
-        "Jumlah Bounce (ASC)": "bounce_asc",
-        "Jumlah Bounce (DESC)": "bounce_desc",
-        "% Bounce (ASC)": "percent_asc",
-        "% Bounce (DESC)": "percent_desc",
-        # EN
-        "Time Added (ASC)": "time_added_asc",
-        "Time Added (DESC)": "time_added_desc",
-        "Key (ASC)": "key_asc",
-        "Key (DESC)": "key_desc",
-        "Press Count (ASC)": "press_asc",
-        "Press Count (DESC)": "press_desc",
-        "Bounce Count (ASC)": "bounce_asc",
-        "Bounce Count (DESC)": "bounce_desc",
-        "% Bounce (ASC)": "percent_asc",
-        "% Bounce (DESC)": "percent_desc",
-    }
-    return mapping_text_to_key.get(text, "time_added_asc")
+    return SORT_TEXT_TO_KEY.get(text, "time_added_asc")
 
 # --------------------------------------------------------------------
 # TAB / UI BINDING
 # --------------------------------------------------------------------
+# Isi Entry angka yang valid: desimal yang bisa di-float() ("12", "-1", "1.",
+# ".5"). Dicek dengan regex per ketikan, tanpa membuat objek exception
+# setiap input ditolak.
+NUMBER_INPUT_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)')
+
+# (lebar widget, kolom) terakhir yang sudah diterapkan per Treeview; pindah tab
+# tanpa resize jendela/ganti bahasa tidak perlu mengatur ulang lebar kolom.
+_applied_column_layout = {}
+
 def adjust_treeview_columns_on_tab_change():
     if use_gui:
         # custom
         if custom_tree:
             total_width_custom = custom_tree.winfo_width()
             cols_custom = custom_tree["columns"]
-            if cols_custom and total_width_custom > 0:
+            layout = (total_width_custom, cols_custom)
+            if cols_custom and total_width_custom > 0 and _applied_column_layout.get('custom') != layout:
                 col_width = int(total_width_custom * 0.99) // len(cols_custom)
                 for col in cols_custom:
                     custom_tree.column(col, width=col_width, minwidth=col_width)
+                _applied_column_layout['custom'] = layout
 
         # stats
         if stats_tree:
             total_width_stats = stats_tree.winfo_width()
-            if total_width_stats > 0:
-                stats_cols = stats_tree["columns"]
+            stats_cols = stats_tree["columns"]
+            layout = (total_width_stats, stats_cols)
+            if total_width_stats > 0 and _applied_column_layout.get('stats') != layout:
                 col_width_stats = int(total_width_stats * 0.99) // len(stats_cols)
                 for col in stats_cols:
                     stats_tree.column(col, width=col_width_stats, minwidth=col_width_stats)
+                _applied_column_layout['stats'] = layout
+
+def set_readonly_entry_text(entry, text):
+    """
+    Isi Entry readonly dengan text; lewati normal->delete->insert->readonly
+    (empat panggilan Tcl) jika isinya sudah sama, cukup pastikan readonly.
+    """
+    if entry.get() == text:
+        if str(entry.cget('state')) != 'readonly':
+            entry.config(state='readonly')
+        return
+    entry.config(state='normal')
+    entry.delete(0, tk.END)
+    if text:
+        entry.insert(0, text)
+    entry.config(state='readonly')
+
+# path tab (str) -> fungsi pembangun widget tab; dipanggil lalu dibuang saat
+# tab itu pertama kali dipilih.
+_tab_builders = {}
 
 def on_tab_changed(event):
+    global stats_tab_visible
+    selected = notebook.select()
+    builder = _tab_builders.pop(selected, None)
+    if builder is not None:
+        builder()
     adjust_treeview_columns_on_tab_change()
+    stats_tab_visible = (selected == str(tab_stats))
+    if stats_tab_visible:
+        update_stats_rows()
+    if selected == str(tab1):
+        catch_up_log_widget(input_text)
+    elif selected == str(tab2):
+        catch_up_log_widget(bounce_text)
+    else:
+        catch_up_log_widget(None)
     try:
-        custom_key_entry.config(state='normal')
-        if custom_key_entry.get() in ["PRESS KEY", "TEKAN TOMBOL"]:
-            custom_key_entry.delete(0, tk.END)
-        custom_key_entry.config(state='readonly')
+        if custom_key_entry:
+            current = custom_key_entry.get()
+            set_readonly_entry_text(custom_key_entry,
+                                    "" if current in ["PRESS KEY", "TEKAN TOMBOL"] else current)
         if pause_entry_global:
-            pause_entry_global.config(state='normal')
-            pause_entry_global.delete(0, tk.END)
-            if shortcut_pause:
-                pause_entry_global.insert(0, shortcut_pause)
-            pause_entry_global.config(state='readonly')
+            set_readonly_entry_text(pause_entry_global, shortcut_pause)
         if continue_entry_global:
-            continue_entry_global.config(state='normal')
-            continue_entry_global.delete(0, tk.END)
-            if shortcut_continue:
-                continue_entry_global.insert(0, shortcut_continue)
-            continue_entry_global.config(state='readonly')
+            set_readonly_entry_text(continue_entry_global, shortcut_continue)
     except Exception:
         pass
 
@@ -1110,11 +2054,14 @@ def update_ui_language():
         notebook.tab(tab6, text=lang_ui.get('tab_advanced', "Advanced Settings"))
         notebook.tab(tab7, text=lang_ui.get('tab_about', "About"))
 
-        custom_label_key.configure(text=("Tombol:" if current_language=='id' else "Key:"))
-        custom_label_thr.configure(text=("Batas (ms):" if current_language=='id' else "Threshold (ms):"))
-        detect_button.configure(text=lang_ui.get('btn_detect', "Detect"))
-        custom_save_button.configure(text=lang_ui.get('btn_save', "Save"))
-        delete_button.configure(text=lang_ui.get('btn_delete', "Delete"))
+        # Tab yang belum pernah dibuka belum punya widget; saat dibangun
+        # nanti teksnya langsung memakai current_language.
+        if custom_label_key:
+            custom_label_key.configure(text=("Tombol:" if current_language=='id' else "Key:"))
+            custom_label_thr.configure(text=("Batas (ms):" if current_language=='id' else "Threshold (ms):"))
+            detect_button.configure(text=lang_ui.get('btn_detect', "Detect"))
+            custom_save_button.configure(text=lang_ui.get('btn_save', "Save"))
+            delete_button.configure(text=lang_ui.get('btn_delete', "Delete"))
         update_ui_pause_tab()
 
         # Stats header
@@ -1124,37 +2071,30 @@ def update_ui_language():
             lang_ui['stats_col_bounce'],
             lang_ui['stats_col_percent']
         )
-        stats_tree["columns"] = stats_cols
-        for col in stats_cols:
-            stats_tree.heading(col, text=col)
+        # Mengganti -columns mereset semua kolom (lebar, heading) dan mengganti
+        # values membuat Combobox menata ulang daftarnya; keduanya hanya
+        # dilakukan jika bahasanya memang berubah.
+        if tuple(stats_tree["columns"]) != stats_cols:
+            stats_tree["columns"] = stats_cols
+            for col in stats_cols:
+                stats_tree.heading(col, text=col)
 
         # Sorting label
         sorting_label.configure(text=lang_ui.get('sorting_label', "Sort By:"))
-        sort_items = [
-            lang_ui.get('sorting_time_added_asc', "Time Added (ASC)"),
-            lang_ui.get('sorting_time_added_desc', "Time Added (DESC)"),
-            lang_ui.get('sorting_key_asc', "Key (ASC)"),
-            lang_ui.get('sorting_key_desc', "Key (DESC)"),
-            lang_ui.get('sorting_press_asc', "Press Count (ASC)"),
-            lang_ui.get('sorting_press_desc', "Press Count (DESC)"),
-            lang_ui.get('sorting_bounce_asc', "Bounce Count (ASC)"),
-            lang_ui.get('sorting_bounce_desc', "Bounce Count (DESC)"),
-            lang_ui.get('sorting_percent_asc', "% Bounce (ASC)"),
-            lang_ui.get('sorting_percent_desc', "% Bounce (DESC)")
-        ]
-        stats_sort_combobox.config(values=sort_items)
+        sort_items = SORT_ITEMS[current_language]
+        if tuple(stats_sort_combobox.cget("values")) != tuple(sort_items):
+            stats_sort_combobox.config(values=sort_items)
 
         # About Tab
-        about_title_label.config(text=lang_ui.get('about_title', "Keyboard Debounce v1.1.0"))
-        about_license_label.config(text=lang_ui.get('about_license', "MIT License"))
-        about_copyright_label.config(
-            text=lang_ui.get('about_copyright', "Copyright (c) 2025")
-        )
-        about_title_label.configure(anchor="w", justify="left")
-        about_license_label.configure(anchor="w", justify="left")
-        about_copyright_label.configure(anchor="w", justify="left")
-
-        license_label.configure(anchor="w", justify="left")
+        if about_title_label:
+            about_title_label.config(text=lang_ui.get('about_title', "Keyboard Debounce v1.1.0"))
+            about_license_label.config(text=lang_ui.get('about_license', "MIT License"))
+            about_copyright_label.config(
+                text=lang_ui.get('about_copyright', "Copyright (c) 2025")
+            )
+            about_title_label.configure(anchor="w", justify="left")
+            about_license_label.configure(anchor="w", justify="left")
+            about_copyright_label.configure(anchor="w", justify="left")
 
         render_stats_table()
 
@@ -1188,40 +2128,143 @@ def switch_language_to(lang):
     global current_language
     current_language = lang
     save_config()
+    build_active_templates()
     render_all_logs()
     if use_gui:
-        pause_entry_global.config(state='normal')
-        pause_entry_global.delete(0, tk.END)
-        if shortcut_pause:
-            pause_entry_global.insert(0, shortcut_pause)
-        pause_entry_global.config(state='readonly')
-        continue_entry_global.config(state='normal')
-        continue_entry_global.delete(0, tk.END)
-        if shortcut_continue:
-            continue_entry_global.insert(0, shortcut_continue)
-        continue_entry_global.config(state='readonly')
+        update_ui_pause_tab()
+        stop_log_writer()
         os.execv(sys.executable, [sys.executable] + sys.argv)
 
-def find_keyboard_device():
-    devices = [InputDevice(path) for path in list_devices()]
-    for dev in devices:
+PROC_INPUT_DEVICES = "/proc/bus/input/devices"
+
+def keyboard_paths_from_proc():
+    """
+    Cari kandidat keyboard dari /proc/bus/input/devices tanpa membuka node
+    /dev/input satu per satu. Blok perangkat dianggap keyboard jika bit EV_KEY
+    ada di 'B: EV=' dan bit KEY_A ada di 'B: KEY='. Mengembalikan None jika
+    file tidak bisa dibaca/di-parse, agar pemanggil kembali ke scan biasa.
+    """
+    try:
+        with open(PROC_INPUT_DEVICES) as f:
+            text = f.read()
+    except OSError:
+        return None
+    paths = []
+    for block in text.split("\n\n"):
+        ev_bits = 0
+        key_words = []
+        event_node = None
+        for line in block.splitlines():
+            if line.startswith("B: EV="):
+                ev_bits = int(line[6:], 16)
+            elif line.startswith("B: KEY="):
+                key_words = line[7:].split()
+            elif line.startswith("H: Handlers="):
+                for handler in line[12:].split():
+                    if handler.startswith("event"):
+                        event_node = handler
+        if event_node is None or not (ev_bits >> ecodes.EV_KEY) & 1 or not key_words:
+            continue
+        # Bitmap KEY dicetak per word (unsigned long), word paling tinggi di depan.
+        # KEY_A (30) selalu berada di word terakhir, baik long 32- maupun 64-bit.
+        if (int(key_words[-1], 16) >> ecodes.KEY_A) & 1:
+            paths.append("/dev/input/" + event_node)
+    return paths
+
+def open_if_keyboard(path):
+    try:
+        dev = InputDevice(path)
+    except OSError:
+        return None
+    try:
         caps = dev.capabilities()
         if ecodes.EV_KEY in caps and ecodes.KEY_A in caps[ecodes.EV_KEY]:
             return dev
+    except OSError:
+        pass
+    dev.close()
     return None
 
-def is_qemu_kvm_active():
+def find_keyboard_device():
+    """
+    Utamakan kandidat dari /proc/bus/input/devices sehingga biasanya hanya satu
+    node yang dibuka. Jika tidak ada kandidat yang cocok, kembali membuka
+    perangkat input satu per satu dan langsung tutup yang bukan keyboard.
+    Perangkat yang sedang sibuk atau tidak bisa dibuka dilewati.
+    """
+    try:
+        candidates = keyboard_paths_from_proc()
+    except ValueError:
+        candidates = None
+    for path in candidates or ():
+        dev = open_if_keyboard(path)
+        if dev is not None:
+            return dev
+    for path in list_devices():
+        if candidates and path in candidates:
+            continue
+        dev = open_if_keyboard(path)
+        if dev is not None:
+            return dev
+    return None
+
+def scan_qemu_processes():
+    """
+    Setara `pgrep -f qemu-system`, tetapi membaca /proc/<pid>/cmdline langsung
+    tanpa fork/exec proses baru.
+    """
+    my_pid = os.getpid()
     try:
-        output = subprocess.check_output(["pgrep", "-f", "qemu-system"], universal_newlines=True)
-        return bool(output.strip())
-    except subprocess.CalledProcessError:
+        pids = os.listdir('/proc')
+    except OSError:
         return False
+    for pid in pids:
+        if not pid.isdigit() or int(pid) == my_pid:
+            continue
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                if b'qemu-system' in f.read():
+                    return True
+        except OSError:
+            # Proses sudah selesai atau tidak bisa dibaca
+            continue
+    return False
+
+def is_qemu_kvm_active():
+    """
+    Hasil scan di-cache selama QEMU_CHECK_INTERVAL, sehingga shortcut
+    pause/continue dan tombol manual tidak memicu scan baru setiap kali ditekan.
+    """
+    global _qemu_scan_cache
+    now = time.monotonic()
+    checked_at, active = _qemu_scan_cache
+    if now - checked_at < QEMU_CHECK_INTERVAL:
+        return active
+    active = scan_qemu_processes()
+    _qemu_scan_cache = (now, active)
+    return active
 
 # --------------------------------------------------------------------
 # MONITOR KEYBOARD (thread)
 # --------------------------------------------------------------------
+# _IOW('E', 0xa0, int): pilih clock untuk timestamp event di fd evdev ini
+EVIOCSCLOCKID = 0x400445a0
+
+def use_monotonic_event_clock(dev):
+    """
+    Minta kernel memberi timestamp event dengan CLOCK_MONOTONIC, sehingga
+    waktu tiap event bisa langsung dipakai untuk perbandingan bounce (tidak
+    perlu time.monotonic_ns() per event dan tidak ikut loncat saat jam sistem
+    diubah). Mengembalikan False jika ioctl tidak didukung.
+    """
+    try:
+        fcntl.ioctl(dev.fd, EVIOCSCLOCKID, array.array('i', [time.CLOCK_MONOTONIC]))
+        return True
+    except (OSError, AttributeError):
+        return False
+
 def monitor_keyboard():
-    global paused, forced_pause, global_keyboard_grabbed
+    global paused, forced_pause
     global _last_qemu_check, _qemu_active
 
     dev = find_keyboard_device()
@@ -1240,7 +2283,7 @@ def monitor_keyboard():
     except Exception:
         grabbed_by_app = False
 
-    global_keyboard_grabbed = grabbed_by_app
+    set_keyboard_grabbed(grabbed_by_app)
     _last_qemu_check = time.time()
 
     forced_pause = False
@@ -1248,9 +2291,30 @@ def monitor_keyboard():
         paused = True
         forced_pause = True
 
+    # Alias lokal untuk nama yang dipakai setiap event: LOAD_FAST, bukan
+    # LOAD_GLOBAL/atribut. Hanya objek yang tidak pernah diganti selama loop
+    # (tabel per-keycode diubah in-place); flag yang bisa diubah GUI tetap
+    # dibaca dari global.
+    read_all = dev.read
+    # Objek poll didaftarkan sekali; select.select membangun ulang fd_set di
+    # setiap panggilan.
+    poller = select.poll()
+    poller.register(dev.fd, select.POLLIN)
+    wait_readable = poller.poll
+    wait_timeout_ms = int(QEMU_CHECK_INTERVAL * 1000)
+    monotonic_ns = time.monotonic_ns
+    kernel_timestamps = use_monotonic_event_clock(dev)
+    ev_key = ecodes.EV_KEY
+    key_names = KEY_NAMES
+    key_to_uinput = KEY_TO_UINPUT
+    emit = uinput_device.emit
+    is_pause_key = shortcut_pause_keys
+    thresholds_ns = thresholds_ns_by_code
+    is_continue_key = shortcut_continue_keys
+
     while True:
         now = time.time()
-        if now - _last_qemu_check > 0.5:
+        if now - _last_qemu_check > QEMU_CHECK_INTERVAL:
             _qemu_active = is_qemu_kvm_active() if force_disable_qemu else False
             _last_qemu_check = now
             if _qemu_active:
@@ -1260,7 +2324,7 @@ def monitor_keyboard():
                     try:
                         dev.ungrab()
                         grabbed_by_app = False
-                        global_keyboard_grabbed = False
+                        set_keyboard_grabbed(False)
                         queue_input_event('force_disable_qemu', {'note': 'QEMU aktif, keyboard ungrab otomatis'})
                     except Exception as e:
                         queue_input_event('inject_down_error', {'key': 'N/A', 'error': f"ungrab error: {str(e)}"})
@@ -1272,7 +2336,7 @@ def monitor_keyboard():
                         try:
                             dev.grab()
                             grabbed_by_app = True
-                            global_keyboard_grabbed = True
+                            set_keyboard_grabbed(True)
                             play_sound("continue.wav")
                             queue_input_event('grab_enabled', {'note': 'Force mode: QEMU nonaktif, keyboard grabbed otomatis'})
                             queue_input_event('continue_activated', {'key': 'AUTO_FORCE'})
@@ -1284,7 +2348,7 @@ def monitor_keyboard():
                 try:
                     dev.ungrab()
                     grabbed_by_app = False
-                    global_keyboard_grabbed = False
+                    set_keyboard_grabbed(False)
                 except Exception as e:
                     queue_input_event('inject_down_error', {'key': 'N/A', 'error': f"ungrab error: {str(e)}"})
         else:
@@ -1292,161 +2356,173 @@ def monitor_keyboard():
                 try:
                     dev.grab()
                     grabbed_by_app = True
-                    global_keyboard_grabbed = True
+                    set_keyboard_grabbed(True)
                 except:
                     pass
 
-        event = dev.read_one()
-        if event is None:
-            time.sleep(0.01)
-            continue
-
-        if event.type != ecodes.EV_KEY:
+        # Ambil semua event yang sudah antre dalam satu read(2), bukan satu
+        # syscall per event; pengecekan QEMU/grab di atas jadi sekali per batch.
+        # dev.read() adalah generator, jadi BlockingIOError baru muncul saat
+        # diiterasi; list() memastikannya tertangkap di sini.
+        try:
+            events = list(read_all())
+        except BlockingIOError:
+            # Tidur sampai kernel punya event baru; timeout tetap membangunkan
+            # loop agar pengecekan QEMU/KVM di atas berjalan saat idle.
+            wait_readable(wait_timeout_ms)
             continue
 
-        key_event = categorize(event)
-        raw_key = key_event.keycode if isinstance(key_event.keycode, str) else key_event.keycode[0]
-        norm_key = normalize_key(raw_key)
-        keystate = key_event.keystate
-        now = time.time()
-
-        # Shortcut pause/continue
-        if keystate == 1:  # Key down
-            if shortcut_pause and norm_key == shortcut_pause and not paused:
-                if force_disable_qemu and is_qemu_kvm_active():
-                    continue
-                paused = True
-                forced_pause = False
-                queue_input_event('inject_down_pause', {'key': norm_key})
-                try:
-                    dev.ungrab()
-                    grabbed_by_app = False
-                    global_keyboard_grabbed = False
-                except:
-                    pass
-                play_sound("pause.wav")
-                queue_input_event('pause_activated', {'key': norm_key})
+        # Tanpa timestamp kernel: satu sampel waktu untuk seluruh batch
+        batch_ns = 0 if kernel_timestamps else monotonic_ns()
+        # Setting yang tetap selama satu batch dibaca sekali ke variabel lokal
+        qemu_block = force_disable_qemu and _qemu_active
+        after_release = bounce_mode == "up"
+        for event in events:
+            if event.type != ev_key:
+                continue
+            # Autorepeat dari kernel (value 2) tidak dipakai: repeat dibuat sendiri
+            # oleh repeat thread, jadi buang di sini sebelum lookup apa pun.
+            if event.value == 2:
                 continue
 
-            if shortcut_continue and norm_key == shortcut_continue and paused:
-                if force_disable_qemu and is_qemu_kvm_active():
+            code = event.code
+            norm_key = key_names[code]
+            keystate = event.value
+            if kernel_timestamps:
+                now_ns = event.sec * 1_000_000_000 + event.usec * 1000
+            else:
+                now_ns = batch_ns
+
+            # Shortcut pause/continue
+            if keystate == 1:  # Key down
+                if is_pause_key[code] and not paused:
+                    if force_disable_qemu and is_qemu_kvm_active():
+                        continue
+                    paused = True
+                    forced_pause = False
+                    queue_input_event('inject_down_pause', {'key': norm_key})
+                    try:
+                        dev.ungrab()
+                        grabbed_by_app = False
+                        set_keyboard_grabbed(False)
+                    except:
+                        pass
                     play_sound("pause.wav")
-                    queue_input_event('grab_failed_qemu_active', {'error': 'QEMU/KVM active'})
+                    queue_input_event('pause_activated', {'key': norm_key})
                     continue
-                paused = False
-                forced_pause = False
-                try:
-                    if not is_qemu_kvm_active():
-                        dev.grab()
-                        grabbed_by_app = True
-                        global_keyboard_grabbed = True
-                        play_sound("continue.wav")
-                        queue_input_event('grab_enabled', {'note': 'Grab re-enabled'})
-                        queue_input_event('continue_activated', {'key': norm_key})
-                    else:
+
+                if is_continue_key[code] and paused:
+                    if force_disable_qemu and is_qemu_kvm_active():
                         play_sound("pause.wav")
                         queue_input_event('grab_failed_qemu_active', {'error': 'QEMU/KVM active'})
-                except Exception as e:
-                    queue_input_event('grab_failed_qemu_active', {'error': str(e)})
+                        continue
+                    paused = False
+                    forced_pause = False
+                    try:
+                        if not is_qemu_kvm_active():
+                            dev.grab()
+                            grabbed_by_app = True
+                            set_keyboard_grabbed(True)
+                            play_sound("continue.wav")
+                            queue_input_event('grab_enabled', {'note': 'Grab re-enabled'})
+                            queue_input_event('continue_activated', {'key': norm_key})
+                        else:
+                            play_sound("pause.wav")
+                            queue_input_event('grab_failed_qemu_active', {'error': 'QEMU/KVM active'})
+                    except Exception as e:
+                        queue_input_event('grab_failed_qemu_active', {'error': str(e)})
+                    continue
+
+            if paused:
+                if not qemu_block:
+                    if keystate == 1:
+                        queue_input_event('inject_down_pause', {'key': norm_key, 'note': 'Sedang Pause'})
+                    elif keystate == 0:
+                        queue_input_event('inject_up_pause', {'key': norm_key, 'note': 'Sedang Pause'})
                 continue
 
-        if paused:
-            if not (force_disable_qemu and _qemu_active):
+            # MAIN BOUNCE CHECK
+            if after_release:  # After Release
                 if keystate == 1:
-                    queue_input_event('inject_down_pause', {'key': norm_key, 'note': 'Sedang Pause'})
-                elif keystate == 0:
-                    queue_input_event('inject_up_pause', {'key': norm_key, 'note': 'Sedang Pause'})
-            continue
-
-        # MAIN BOUNCE CHECK
-        if bounce_mode == "up":  # After Release
-            if keystate == 1:
-                threshold_used = custom_thresholds.get(norm_key, bounce_time)
-                last_rel = last_release_time_per_key.get(norm_key, 0.0)
-                elapsed = now - last_rel
-                if elapsed < threshold_used:
-                    keys_were_down_blocked[norm_key] = True
-                    queue_stats_bounce(norm_key)
-                    queue_bounce_event('bounce_detected', {
-                        'key': norm_key,
-                        'delay': int(elapsed*1000),
-                        'threshold': int(threshold_used*1000)
-                    })
+                    threshold_ns = thresholds_ns[code]
+                    last_rel = last_release_time_per_key[code]
+                    elapsed = now_ns - last_rel
+                    if last_rel != 0 and elapsed < threshold_ns:
+                        keys_were_down_blocked[code] = 1
+                        queue_stats_bounce(norm_key)
+                        queue_bounce_event('bounce_detected', {
+                            'key': norm_key,
+                            'delay': elapsed // 1_000_000,
+                            'threshold': threshold_ns // 1_000_000
+                        })
+                        stop_repeat(norm_key)
+                    else:
+                        keys_were_down_blocked[code] = 0
+                        delay_val = None
+                        if last_rel != 0:
+                            delay_val = elapsed // 1_000_000
+                        queue_input_event('inject_down_custom', {
+                            'key': norm_key,
+                            'delay': delay_val
+                        })
+                        queue_stats_press(norm_key)
+                        try:
+                            emit(key_to_uinput[code], 1)
+                        except Exception as e:
+                            queue_input_event('inject_down_error', {'key': norm_key, 'error': str(e)})
+                        start_repeat(norm_key, code)
+                else:  # up
                     stop_repeat(norm_key)
-                else:
-                    keys_were_down_blocked[norm_key] = False
-                    last_press_time_per_key[norm_key] = now
-                    delay_val = None
-                    if norm_key in last_release_time_per_key and last_release_time_per_key[norm_key] != 0.0:
-                        delay_val = int(elapsed*1000)
-                    queue_input_event('inject_down_custom', {
-                        'key': norm_key,
-                        'delay': delay_val
-                    })
-                    queue_stats_press(norm_key)
-                    try:
-                        uinput_device.emit(getattr(uinput, norm_key), 1)
-                    except Exception as e:
-                        queue_input_event('inject_down_error', {'key': norm_key, 'error': str(e)})
-                    start_repeat(norm_key)
-            elif keystate == 2:
-                pass
-            else:  # up
-                stop_repeat(norm_key)
-                blocked = keys_were_down_blocked.get(norm_key, False)
-                if blocked:
-                    keys_were_down_blocked[norm_key] = False
-                else:
-                    queue_input_event('inject_up_custom', {'key': norm_key})
-                    try:
-                        uinput_device.emit(getattr(uinput, norm_key), 0)
-                    except Exception as e:
-                        queue_input_event('inject_up_error', {'key': norm_key, 'error': str(e)})
-                    last_release_time_per_key[norm_key] = now
-        else:  # bounce_mode == "down"
-            if keystate == 1:
-                threshold_used = custom_thresholds.get(norm_key, bounce_time)
-                last_time = last_valid_down_time_per_key.get(norm_key, None)
-                now_ts = now
-                start_repeat(norm_key)
-                if last_time is None or (now_ts - last_time >= threshold_used):
-                    last_valid_down_time_per_key[norm_key] = now_ts
-                    if norm_key not in first_event_down_per_key:
-                        queue_input_event('inject_down_first_global', {'key': norm_key})
-                        first_event_down_per_key.add(norm_key)
+                    if keys_were_down_blocked[code]:
+                        keys_were_down_blocked[code] = 0
                     else:
-                        delay_ms = int((now_ts - last_time)*1000) if last_time else 0
-                        queue_input_event('inject_down_subsequent', {'key': norm_key, 'delay': delay_ms})
-                    queue_stats_press(norm_key)
-                    try:
-                        uinput_device.emit(getattr(uinput, norm_key), 1)
-                    except Exception as e:
-                        queue_input_event('inject_down_error', {'key': norm_key, 'error': str(e)})
-                    valid_keys[norm_key] = now_ts
+                        queue_input_event('inject_up_custom', {'key': norm_key})
+                        try:
+                            emit(key_to_uinput[code], 0)
+                        except Exception as e:
+                            queue_input_event('inject_up_error', {'key': norm_key, 'error': str(e)})
+                        last_release_time_per_key[code] = now_ns
+            else:  # bounce_mode == "down"
+                if keystate == 1:
+                    threshold_ns = thresholds_ns[code]
+                    last_time = last_valid_down_time_per_key[code]
+                    start_repeat(norm_key, code)
+                    if last_time == 0 or (now_ns - last_time >= threshold_ns):
+                        last_valid_down_time_per_key[code] = now_ns
+                        if last_time == 0:
+                            queue_input_event('inject_down_first_global', {'key': norm_key})
+                        else:
+                            delay_ms = (now_ns - last_time) // 1_000_000
+                            queue_input_event('inject_down_subsequent', {'key': norm_key, 'delay': delay_ms})
+                        queue_stats_press(norm_key)
+                        try:
+                            emit(key_to_uinput[code], 1)
+                        except Exception as e:
+                            queue_input_event('inject_down_error', {'key': norm_key, 'error': str(e)})
+                        valid_keys[code] = 1
+                    else:
+                        queue_stats_bounce(norm_key)
+                        queue_bounce_event('bounce_detected', {
+                            'key': norm_key,
+                            'delay': (now_ns - last_time) // 1_000_000,
+                            'threshold': threshold_ns // 1_000_000
+                        })
                 else:
-                    queue_stats_bounce(norm_key)
-                    queue_bounce_event('bounce_detected', {
-                        'key': norm_key,
-                        'delay': int((now_ts - last_time)*1000) if last_time else 0,
-                        'threshold': int(threshold_used*1000)
-                    })
-            elif keystate == 2:
-                pass
-            else:
-                stop_repeat(norm_key)
-                if norm_key in valid_keys:
-                    try:
-                        uinput_device.emit(getattr(uinput, norm_key), 0)
-                    except Exception as e:
-                        queue_input_event('inject_up_error', {'key': norm_key, 'error': str(e)})
-                    del valid_keys[norm_key]
-                    queue_input_event('inject_up', {'key': norm_key})
+                    stop_repeat(norm_key)
+                    if valid_keys[code]:
+                        try:
+                            emit(key_to_uinput[code], 0)
+                        except Exception as e:
+                            queue_input_event('inject_up_error', {'key': norm_key, 'error': str(e)})
+                        valid_keys[code] = 0
+                        queue_input_event('inject_up', {'key': norm_key})
 
 def update_bounce_threshold():
     global bounce_time
     try:
         val_ms = float(bounce_entry.get())
         bounce_time = val_ms / 1000.0
+        refresh_thresholds_ns()
         save_config()
         queue_input_event('threshold_update', {'threshold': int(val_ms)})
     except ValueError:
@@ -1461,15 +2537,16 @@ def run_background():
     """
     load_config()
     load_logs_all()
+    start_log_writer()
 
     # Jalankan pemantau keyboard di thread terpisah
     monitor_thread = threading.Thread(target=monitor_keyboard, daemon=True)
     monitor_thread.start()
 
-    # Loop utama: proses event_queue supaya log tersimpan
+    # Loop utama: proses event_queue supaya log tersimpan. Tidak ada polling;
+    # thread utama tidur di event_queue sampai ada event dari pemantau.
     while True:
-        process_event_queue()
-        time.sleep(0.05)
+        process_event_queue(wait_timeout=1.0)
 
 # --------------------------------------------------------------------
 # GUI atau NO-GUI
@@ -1482,12 +2559,16 @@ btn_manual_continue_global = None
 btn_detect_pause_global = None
 btn_detect_continue_global = None
 btn_save_shortcut_global = None
+custom_label_key = None
+custom_key_entry = None
+about_title_label = None
 input_text = None
 bounce_text = None
 
 if use_gui:
     load_config()
     load_logs_all()
+    start_log_writer()
 
     root = ThemedTk(theme="arc", className="Keyboard Debounce")
 
@@ -1505,6 +2586,15 @@ if use_gui:
         ]
     )
 
+    # Warna indikator status: dua style tetap, ganti status cukup tukar style
+    style.configure("StatusOn.TLabel", foreground="green")
+    style.configure("StatusOff.TLabel", foreground="gray")
+
+    # Hapus seleksi teks saat fokus berpindah: satu binding per kelas widget,
+    # bukan lambda terpisah untuk setiap Entry/Combobox.
+    root.bind_class("TEntry", "<FocusOut>", lambda e: e.widget.selection_clear(), add="+")
+    root.bind_class("TCombobox", "<FocusIn>", lambda e: e.widget.selection_clear(), add="+")
+
     lang_ui = LANG_UI[current_language]
     root.title(lang_ui['window_title'])
 
@@ -1515,20 +2605,15 @@ if use_gui:
     bounce_label.pack(side=tk.LEFT, padx=(0,5))
 
     def validate_number(action, value_if_allowed):
-        if action != '1':
-            return True
-        try:
-            float(value_if_allowed)
-            return True
-        except ValueError:
-            return False
+        return action != '1' or NUMBER_INPUT_RE.fullmatch(value_if_allowed) is not None
 
+    # Satu command Tcl untuk semua Entry angka (threshold, custom threshold,
+    # repeat rate/delay); tab lain memakai ulang vcmd, tidak register lagi.
     vcmd = (root.register(validate_number), '%d', '%P')
     bounce_entry = ttk.Entry(top_frame, width=10, validate='key',
                              validatecommand=vcmd, exportselection=0)
     bounce_entry.insert(0, str(int(bounce_time * 1000)))
     bounce_entry.pack(side=tk.LEFT)
-    bounce_entry.bind("<FocusOut>", lambda e: e.widget.selection_clear())
 
     apply_button = ttk.Button(top_frame, text=lang_ui['btn_apply'], command=update_bounce_threshold)
     apply_button.pack(side=tk.LEFT, padx=(5,10))
@@ -1569,34 +2654,17 @@ if use_gui:
     sorting_label = ttk.Label(sort_frame, text=lang_ui.get('sorting_label', "Sort By:"))
     sorting_label.pack(side=tk.LEFT, padx=(0,5))
 
-    sort_items = [
-        lang_ui.get('sorting_time_added_asc', "Time Added (ASC)"),
-        lang_ui.get('sorting_time_added_desc', "Time Added (DESC)"),
-        lang_ui.get('sorting_key_asc', "Key (ASC)"),
-        lang_ui.get('sorting_key_desc', "Key (DESC)"),
-        lang_ui.get('sorting_press_asc', "Press Count (ASC)"),
-        lang_ui.get('sorting_press_desc', "Press Count (DESC)"),
-        lang_ui.get('sorting_bounce_asc', "Bounce Count (ASC)"),
-        lang_ui.get('sorting_bounce_desc', "Bounce Count (DESC)"),
-        lang_ui.get('sorting_percent_asc', "% Bounce (ASC)"),
-        lang_ui.get('sorting_percent_desc', "% Bounce (DESC)")
-    ]
+    sort_items = SORT_ITEMS[current_language]
 
     stats_sort_combobox = ttk.Combobox(sort_frame,
                                        values=sort_items,
                                        state="readonly",
                                        width=25,
                                        exportselection=0)
-    stats_sort_combobox.bind("<FocusIn>", lambda e: e.widget.selection_clear())
     stats_sort_combobox.set(sort_items[0])
     stats_sort_combobox.pack(side=tk.LEFT)
 
-    def combobox_selection_changed(event):
-        global stats_sort_mode
-        stats_sort_mode = stats_sort_combobox.get()
-        render_stats_table(preserve_scroll=False)
-
-    stats_sort_combobox.bind("<<ComboboxSelected>>", combobox_selection_changed)
+    stats_sort_combobox.bind("<<ComboboxSelected>>", on_stats_sort_changed)
 
     tab1 = ttk.Frame(notebook)
     notebook.add(tab1, text=lang_ui['tab_input_log'])
@@ -1622,182 +2690,175 @@ if use_gui:
     bounce_text = ScrolledText(tab2, height=20, state='disabled')
     bounce_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-    custom_frame = ttk.Frame(tab3, padding="10")
-    custom_frame.pack(fill=tk.X, pady=(0,10))
-
-    custom_label_key = ttk.Label(custom_frame, text=("Tombol:" if current_language=='id' else "Key:"))
-    custom_label_key.grid(row=0, column=0, sticky="w", padx=5, pady=5)
-    custom_key_entry = ttk.Entry(custom_frame, width=15, state='readonly', exportselection=0)
-    custom_key_entry.grid(row=0, column=1, sticky="w", padx=5, pady=5)
-    custom_key_entry.bind("<FocusOut>", lambda e: e.widget.selection_clear())
-
-    detect_button = ttk.Button(custom_frame, text=lang_ui.get('btn_detect', "Detect"), command=detect_custom_key)
-    detect_button.grid(row=0, column=2, padx=5, pady=5)
-
-    custom_label_thr = ttk.Label(custom_frame, text=("Batas (ms):" if current_language=='id' else "Threshold (ms):"))
-    custom_label_thr.grid(row=1, column=0, sticky="w", padx=5, pady=5)
-
-    custom_entry_vcmd = (root.register(validate_number), '%d', '%P')
-    custom_threshold_entry = ttk.Entry(custom_frame, width=15, validate='key',
-                                       validatecommand=custom_entry_vcmd, exportselection=0)
-    custom_threshold_entry.grid(row=1, column=1, sticky="w", padx=5, pady=5)
-    custom_threshold_entry.bind("<FocusOut>", lambda e: e.widget.selection_clear())
-
-    custom_save_button = ttk.Button(custom_frame, text=lang_ui.get('btn_save', "Save"), command=update_custom_threshold_gui)
-    custom_save_button.grid(row=1, column=2, padx=5, pady=5)
-
-    tree_frame = ttk.Frame(tab3, padding="10")
-    tree_frame.pack(fill=tk.BOTH, expand=True)
-    headers = ("Tombol", "Batas (ms)") if current_language=='id' else ("Key", "Threshold (ms)")
-    custom_tree = ttk.Treeview(tree_frame, columns=headers, show="headings", selectmode="browse")
-    for col in headers:
-        custom_tree.heading(col, text=col)
-        custom_tree.column(col, anchor="center", stretch=True)
-    custom_tree.grid(row=0, column=0, sticky="nsew")
-    tree_frame.columnconfigure(0, weight=1)
-    tree_frame.rowconfigure(0, weight=1)
-    tree_scroll = ttk.Scrollbar(tree_frame, orient="vertical", command=custom_tree.yview)
-    custom_tree.configure(yscroll=tree_scroll.set)
-    tree_scroll.grid(row=0, column=1, sticky="ns")
-
-    delete_button = ttk.Button(tab3, text=lang_ui.get('btn_delete', "Delete"), command=delete_custom_threshold)
-    delete_button.pack(pady=5)
-
-    pause_frame_global = ttk.Frame(tab5, padding="10")
-    pause_frame_global.pack(fill=tk.X, pady=(0,10))
-
-    label_pause = ttk.Label(pause_frame_global, text=lang_ui.get('label_pause_shortcut', "Pause Shortcut:"))
-    label_pause.grid(row=0, column=0, sticky="w", padx=5, pady=5)
-    pause_entry_global = ttk.Entry(pause_frame_global, width=15, state='readonly', exportselection=0)
-    pause_entry_global.grid(row=0, column=1, sticky="w", padx=5, pady=5)
-    pause_entry_global.bind("<FocusOut>", lambda e: e.widget.selection_clear())
-
-    btn_detect_pause_global = ttk.Button(pause_frame_global, text=lang_ui.get('btn_detect_pause', "Detect"),
-                                         command=lambda: detect_pause_key(pause_entry_global))
-    btn_detect_pause_global.grid(row=0, column=2, padx=5, pady=5)
-    btn_manual_pause_global = ttk.Button(pause_frame_global, text=lang_ui.get('btn_manual_pause', "Manual Pause"),
-                                         command=manual_pause_action)
-    btn_manual_pause_global.grid(row=0, column=3, padx=5, pady=5)
-
-    label_continue = ttk.Label(pause_frame_global, text=lang_ui.get('label_continue_shortcut', "Continue Shortcut:"))
-    label_continue.grid(row=1, column=0, sticky="w", padx=5, pady=5)
-    continue_entry_global = ttk.Entry(pause_frame_global, width=15, state='readonly', exportselection=0)
-    continue_entry_global.grid(row=1, column=1, sticky="w", padx=5, pady=5)
-    continue_entry_global.bind("<FocusOut>", lambda e: e.widget.selection_clear())
-
-    btn_detect_continue_global = ttk.Button(pause_frame_global, text=lang_ui.get('btn_detect_continue', "Detect"),
-                                            command=lambda: detect_pause_key(continue_entry_global))
-    btn_detect_continue_global.grid(row=1, column=2, padx=5, pady=5)
-    btn_manual_continue_global = ttk.Button(pause_frame_global, text=lang_ui.get('btn_manual_continue', "Manual Continue"),
-                                            command=manual_continue_action)
-    btn_manual_continue_global.grid(row=1, column=3, padx=5, pady=5)
-    btn_save_shortcut_global = ttk.Button(pause_frame_global, text=lang_ui.get('btn_save', "Save"),
-                                          command=lambda: update_pause_shortcuts(pause_entry_global.get(),
-                                                                                 continue_entry_global.get()))
-    btn_save_shortcut_global.grid(row=2, column=0, columnspan=4, pady=10)
-
-    adv_frame = ttk.Frame(tab6, padding="10")
-    adv_frame.pack(fill=tk.X, pady=(0,10))
-
-    force_disable_qemu_var = tk.BooleanVar(value=force_disable_qemu)
-    chk = ttk.Checkbutton(adv_frame,
-                          text=lang_ui.get('chk_force_disable_qemu'),
-                          variable=force_disable_qemu_var,
-                          command=update_force_disable_qemu)
-    chk.pack(anchor="w", pady=(0,10))
-
-    mode_frame = ttk.Frame(adv_frame)
-    mode_frame.pack(fill=tk.X, pady=(5,5))
-
-    detection_mode_label = ttk.Label(mode_frame, text=lang_ui.get('label_detection_mode', "Detection Mode:"))
-    detection_mode_label.pack(side=tk.LEFT, padx=(0,5))
-
-    detection_mode_values = [
-        lang_ui.get('option_key_down', "After Press"),
-        lang_ui.get('option_key_up', "After Release")
-    ]
-    detection_mode_var = tk.StringVar(
-        value=(lang_ui.get('option_key_down', "After Press") if bounce_mode=="down"
-               else lang_ui.get('option_key_up', "After Release"))
-    )
+    # Tab Custom Threshold, Pause, Advanced, dan About baru dibangun saat
+    # pertama kali dipilih (lihat _tab_builders di on_tab_changed); startup
+    # cukup membuat widget tab statistik dan log.
+    def build_custom_threshold_tab():
+        global custom_label_key, custom_key_entry, detect_button, custom_label_thr
+        global custom_threshold_entry, custom_save_button, custom_tree, delete_button
+        custom_frame = ttk.Frame(tab3, padding="10")
+        custom_frame.pack(fill=tk.X, pady=(0,10))
 
-    detection_mode_dropdown = ttk.Combobox(mode_frame,
-                                           textvariable=detection_mode_var,
-                                           values=detection_mode_values,
-                                           state="readonly",
-                                           exportselection=0)
-    detection_mode_dropdown.bind("<FocusIn>", lambda e: e.widget.selection_clear())
-    detection_mode_dropdown.pack(side=tk.LEFT)
-
-    def on_detection_mode_change(event):
-        global bounce_mode
-        selected = detection_mode_var.get().lower()
-        if "press" in selected or "tekan" in selected:
-            new_mode = "down"
-        else:
-            new_mode = "up"
-        if new_mode != bounce_mode:
-            bounce_mode = new_mode
-            save_config()
-            queue_input_event('detection_mode_changed', {'mode': detection_mode_var.get()})
+        custom_label_key = ttk.Label(custom_frame, text=("Tombol:" if current_language=='id' else "Key:"))
+        custom_label_key.grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        custom_key_entry = ttk.Entry(custom_frame, width=15, state='readonly', exportselection=0)
+        custom_key_entry.grid(row=0, column=1, sticky="w", padx=5, pady=5)
 
-    detection_mode_dropdown.bind("<<ComboboxSelected>>", on_detection_mode_change)
+        detect_button = ttk.Button(custom_frame, text=lang_ui.get('btn_detect', "Detect"), command=detect_custom_key)
+        detect_button.grid(row=0, column=2, padx=5, pady=5)
 
-    row2_frame = ttk.Frame(adv_frame)
-    row2_frame.pack(fill=tk.X, pady=(5,5))
+        custom_label_thr = ttk.Label(custom_frame, text=("Batas (ms):" if current_language=='id' else "Threshold (ms):"))
+        custom_label_thr.grid(row=1, column=0, sticky="w", padx=5, pady=5)
 
-    label_hold_r = ttk.Label(row2_frame, text=lang_ui.get('label_hold_rate', "Repeat Rate (keys/sec):"))
-    label_hold_r.pack(side=tk.LEFT, padx=(0,5))
+        custom_threshold_entry = ttk.Entry(custom_frame, width=15, validate='key',
+                                           validatecommand=vcmd, exportselection=0)
+        custom_threshold_entry.grid(row=1, column=1, sticky="w", padx=5, pady=5)
 
-    def validate_float(action, val_if_allowed):
-        if action != '1':
-            return True
-        try:
-            float(val_if_allowed)
-            return True
-        except:
-            return False
-
-    float_vcmd = (row2_frame.register(validate_float), '%d', '%P')
-    entry_hold_rate = ttk.Entry(row2_frame, width=6, validate='key',
-                                validatecommand=float_vcmd, exportselection=0)
-    entry_hold_rate.pack(side=tk.LEFT, padx=(0,10))
-    entry_hold_rate.insert(0, str(repeat_rate))
-    entry_hold_rate.bind("<FocusOut>", lambda e: e.widget.selection_clear())
-
-    label_hold_d = ttk.Label(row2_frame, text=lang_ui.get('label_hold_delay', "Delay before repeat (ms):"))
-    label_hold_d.pack(side=tk.LEFT, padx=(0,5))
-    entry_hold_delay = ttk.Entry(row2_frame, width=6, validate='key',
-                                 validatecommand=float_vcmd, exportselection=0)
-    entry_hold_delay.pack(side=tk.LEFT, padx=(0,10))
-    entry_hold_delay.insert(0, str(int(repeat_delay*1000)))
-    entry_hold_delay.bind("<FocusOut>", lambda e: e.widget.selection_clear())
-
-    btn_apply_hold = ttk.Button(row2_frame, text=lang_ui.get('btn_apply', "Apply"), command=apply_repeat_settings)
-    btn_apply_hold.pack(side=tk.LEFT)
-
-    tab7_frame = ttk.Frame(tab7, padding="10")
-    tab7_frame.pack(fill=tk.BOTH, expand=True)
-
-    about_title_label = ttk.Label(tab7_frame, text=lang_ui.get('about_title',"Keyboard Debounce v1.1.0"),
-                                  font=("TkDefaultFont", 12, "bold"), anchor="w", justify="left")
-    about_title_label.pack(pady=(20,5), padx=10, anchor="w")
-
-    about_license_label = ttk.Label(tab7_frame, text=lang_ui.get('about_license',"MIT License"),
-                                    font=("TkDefaultFont", 10, "bold"), anchor="w", justify="left")
-    about_license_label.pack(pady=(0,5), padx=10, anchor="w")
-
-    copyright_text = lang_ui.get('about_copyright',"Copyright (c) 2025")
-    about_copyright_label = ttk.Label(
-        tab7_frame,
-        text=copyright_text,
-        font=("TkDefaultFont", 10, "bold"),
-        anchor="w",
-        justify="left"
-    )
-    about_copyright_label.pack(pady=(0,10), padx=10, anchor="w")
+        custom_save_button = ttk.Button(custom_frame, text=lang_ui.get('btn_save', "Save"), command=update_custom_threshold_gui)
+        custom_save_button.grid(row=1, column=2, padx=5, pady=5)
+
+        tree_frame = ttk.Frame(tab3, padding="10")
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        headers = ("Tombol", "Batas (ms)") if current_language=='id' else ("Key", "Threshold (ms)")
+        custom_tree = ttk.Treeview(tree_frame, columns=headers, show="headings", selectmode="browse")
+        for col in headers:
+            custom_tree.heading(col, text=col)
+            custom_tree.column(col, anchor="center", stretch=True)
+        custom_tree.grid(row=0, column=0, sticky="nsew")
+        tree_frame.columnconfigure(0, weight=1)
+        tree_frame.rowconfigure(0, weight=1)
+        tree_scroll = ttk.Scrollbar(tree_frame, orient="vertical", command=custom_tree.yview)
+        custom_tree.configure(yscroll=tree_scroll.set)
+        tree_scroll.grid(row=0, column=1, sticky="ns")
 
-    license_str = """Permission is hereby granted, free of charge, to any person obtaining a copy
+        delete_button = ttk.Button(tab3, text=lang_ui.get('btn_delete', "Delete"), command=delete_custom_threshold)
+        delete_button.pack(pady=5)
+
+        render_custom_thresholds()
+
+    def build_pause_tab():
+        global pause_entry_global, continue_entry_global
+        global btn_manual_pause_global, btn_manual_continue_global
+        global btn_detect_pause_global, btn_detect_continue_global, btn_save_shortcut_global
+        pause_frame_global = ttk.Frame(tab5, padding="10")
+        pause_frame_global.pack(fill=tk.X, pady=(0,10))
+
+        label_pause = ttk.Label(pause_frame_global, text=lang_ui.get('label_pause_shortcut', "Pause Shortcut:"))
+        label_pause.grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        pause_entry_global = ttk.Entry(pause_frame_global, width=15, state='readonly', exportselection=0)
+        pause_entry_global.grid(row=0, column=1, sticky="w", padx=5, pady=5)
+
+        btn_detect_pause_global = ttk.Button(pause_frame_global, text=lang_ui.get('btn_detect_pause', "Detect"),
+                                             command=lambda: detect_pause_key(pause_entry_global))
+        btn_detect_pause_global.grid(row=0, column=2, padx=5, pady=5)
+        btn_manual_pause_global = ttk.Button(pause_frame_global, text=lang_ui.get('btn_manual_pause', "Manual Pause"),
+                                             command=manual_pause_action)
+        btn_manual_pause_global.grid(row=0, column=3, padx=5, pady=5)
+
+        label_continue = ttk.Label(pause_frame_global, text=lang_ui.get('label_continue_shortcut', "Continue Shortcut:"))
+        label_continue.grid(row=1, column=0, sticky="w", padx=5, pady=5)
+        continue_entry_global = ttk.Entry(pause_frame_global, width=15, state='readonly', exportselection=0)
+        continue_entry_global.grid(row=1, column=1, sticky="w", padx=5, pady=5)
+
+        btn_detect_continue_global = ttk.Button(pause_frame_global, text=lang_ui.get('btn_detect_continue', "Detect"),
+                                                command=lambda: detect_pause_key(continue_entry_global))
+        btn_detect_continue_global.grid(row=1, column=2, padx=5, pady=5)
+        btn_manual_continue_global = ttk.Button(pause_frame_global, text=lang_ui.get('btn_manual_continue', "Manual Continue"),
+                                                command=manual_continue_action)
+        btn_manual_continue_global.grid(row=1, column=3, padx=5, pady=5)
+        btn_save_shortcut_global = ttk.Button(pause_frame_global, text=lang_ui.get('btn_save', "Save"),
+                                              command=lambda: update_pause_shortcuts(pause_entry_global.get(),
+                                                                                     continue_entry_global.get()))
+        btn_save_shortcut_global.grid(row=2, column=0, columnspan=4, pady=10)
+
+    def build_advanced_tab():
+        global force_disable_qemu_var, entry_hold_rate, entry_hold_delay
+        adv_frame = ttk.Frame(tab6, padding="10")
+        adv_frame.pack(fill=tk.X, pady=(0,10))
+
+        force_disable_qemu_var = tk.BooleanVar(value=force_disable_qemu)
+        chk = ttk.Checkbutton(adv_frame,
+                              text=lang_ui.get('chk_force_disable_qemu'),
+                              variable=force_disable_qemu_var,
+                              command=update_force_disable_qemu)
+        chk.pack(anchor="w", pady=(0,10))
+
+        mode_frame = ttk.Frame(adv_frame)
+        mode_frame.pack(fill=tk.X, pady=(5,5))
+
+        detection_mode_label = ttk.Label(mode_frame, text=lang_ui.get('label_detection_mode', "Detection Mode:"))
+        detection_mode_label.pack(side=tk.LEFT, padx=(0,5))
+
+        option_key_down_text = lang_ui.get('option_key_down', "After Press")
+        option_key_up_text = lang_ui.get('option_key_up', "After Release")
+        detection_mode_values = [option_key_down_text, option_key_up_text]
+        detection_mode_var = tk.StringVar(
+            value=(option_key_down_text if bounce_mode=="down" else option_key_up_text)
+        )
+
+        detection_mode_dropdown = ttk.Combobox(mode_frame,
+                                               textvariable=detection_mode_var,
+                                               values=detection_mode_values,
+                                               state="readonly",
+                                               exportselection=0)
+        detection_mode_dropdown.pack(side=tk.LEFT)
+
+        def on_detection_mode_change(event):
+            global bounce_mode
+            selected = detection_mode_var.get()
+            new_mode = "down" if selected == option_key_down_text else "up"
+            if new_mode != bounce_mode:
+                bounce_mode = new_mode
+                schedule_save_config()
+                queue_input_event('detection_mode_changed', {'mode': selected})
+
+        detection_mode_dropdown.bind("<<ComboboxSelected>>", on_detection_mode_change)
+
+        row2_frame = ttk.Frame(adv_frame)
+        row2_frame.pack(fill=tk.X, pady=(5,5))
+
+        label_hold_r = ttk.Label(row2_frame, text=lang_ui.get('label_hold_rate', "Repeat Rate (keys/sec):"))
+        label_hold_r.pack(side=tk.LEFT, padx=(0,5))
+
+        entry_hold_rate = ttk.Entry(row2_frame, width=6, validate='key',
+                                    validatecommand=vcmd, exportselection=0)
+        entry_hold_rate.pack(side=tk.LEFT, padx=(0,10))
+        entry_hold_rate.insert(0, str(repeat_rate))
+
+        label_hold_d = ttk.Label(row2_frame, text=lang_ui.get('label_hold_delay', "Delay before repeat (ms):"))
+        label_hold_d.pack(side=tk.LEFT, padx=(0,5))
+        entry_hold_delay = ttk.Entry(row2_frame, width=6, validate='key',
+                                     validatecommand=vcmd, exportselection=0)
+        entry_hold_delay.pack(side=tk.LEFT, padx=(0,10))
+        entry_hold_delay.insert(0, str(int(repeat_delay*1000)))
+
+        btn_apply_hold = ttk.Button(row2_frame, text=lang_ui.get('btn_apply', "Apply"), command=apply_repeat_settings)
+        btn_apply_hold.pack(side=tk.LEFT)
+
+    def build_about_tab():
+        global about_title_label, about_license_label, about_copyright_label
+        tab7_frame = ttk.Frame(tab7, padding="10")
+        tab7_frame.pack(fill=tk.BOTH, expand=True)
+
+        about_title_label = ttk.Label(tab7_frame, text=lang_ui.get('about_title',"Keyboard Debounce v1.1.0"),
+                                      font=("TkDefaultFont", 12, "bold"), anchor="w", justify="left")
+        about_title_label.pack(pady=(20,5), padx=10, anchor="w")
+
+        about_license_label = ttk.Label(tab7_frame, text=lang_ui.get('about_license',"MIT License"),
+                                        font=("TkDefaultFont", 10, "bold"), anchor="w", justify="left")
+        about_license_label.pack(pady=(0,5), padx=10, anchor="w")
+
+        copyright_text = lang_ui.get('about_copyright',"Copyright (c) 2025")
+        about_copyright_label = ttk.Label(
+            tab7_frame,
+            text=copyright_text,
+            font=("TkDefaultFont", 10, "bold"),
+            anchor="w",
+            justify="left"
+        )
+        about_copyright_label.pack(pady=(0,10), padx=10, anchor="w")
+
+        license_str = """Permission is hereby granted, free of charge, to any person obtaining a copy
 of this software and associated documentation files (the "Software"), to deal
 in the Software without restriction, including without limitation the rights
 to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
@@ -1815,20 +2876,36 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN 
 THE SOFTWARE.
 """
-    license_label = ttk.Label(tab7_frame, text=license_str, anchor="w", justify="left", wraplength=800)
-    license_label.pack(fill=tk.X, padx=10, pady=(0,10))
-
+        # Teks lisensi sudah dipatah per baris (maks. 78 karakter): tk.Text
+        # read-only dengan wrap='none' tidak menata ulang baris saat lebarnya
+        # berubah, dan tinggi = jumlah baris sehingga tidak ada yang terpotong.
+        license_text = tk.Text(tab7_frame, wrap='none', height=license_str.count('\n'),
+                               borderwidth=0, highlightthickness=0, font="TkDefaultFont",
+                               background=style.lookup("TFrame", "background") or None)
+        license_text.insert('1.0', license_str)
+        license_text.configure(state='disabled')
+        license_text.pack(fill=tk.X, padx=10, pady=(0,10))
+
+    _tab_builders.update({
+        str(tab3): build_custom_threshold_tab,
+        str(tab5): build_pause_tab,
+        str(tab6): build_advanced_tab,
+        str(tab7): build_about_tab,
+    })
     notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
 
     def update_status_indicator():
-        global global_keyboard_grabbed
-        if global_keyboard_grabbed:
-            status_circle_label.config(foreground="green")
+        global _prev_keyboard_grabbed
+        grabbed = global_keyboard_grabbed
+        if grabbed == _prev_keyboard_grabbed:
+            return
+        _prev_keyboard_grabbed = grabbed
+        if grabbed:
+            status_circle_label.configure(style="StatusOn.TLabel")
             status_word_label.config(text="Enable")
         else:
-            status_circle_label.config(foreground="gray")
+            status_circle_label.configure(style="StatusOff.TLabel")
             status_word_label.config(text="Disable")
-        root.after(500, update_status_indicator)
 
     update_status_indicator()
 
@@ -1852,10 +2929,20 @@ THE SOFTWARE.
     )
     link_label.pack(side=tk.LEFT, padx=(5,5))
 
+    # webbrowser tidak diimpor saat startup, tapi dimuat ketika Tk menganggur;
+    # klik pertama di link langsung memakai referensi modul yang sudah ada.
+    webbrowser = None
+
+    def preload_webbrowser():
+        global webbrowser
+        if webbrowser is None:
+            webbrowser = importlib.import_module("webbrowser")
+
     def open_link(event):
-        import webbrowser
+        preload_webbrowser()
         webbrowser.open("https://github.com/mohammadfirmansyah/keyboard-debounce")
     link_label.bind("<Button-1>", open_link)
+    root.after_idle(preload_webbrowser)
 
     copyright_label = ttk.Label(
         bottom_frame,
@@ -1868,15 +2955,31 @@ THE SOFTWARE.
 
     root.after(50, process_event_queue)
 
+    # Title bar hanya bisa hilang akibat event window manager, jadi cek dipicu
+    # oleh <Map>/<Configure> milik root (bukan polling tiap 2 detik). Event
+    # beruntun (mis. saat resize) digabung jadi satu cek lewat after(500).
+    _titlebar_check_pending = None
+
     def cek_titlebar():
-        root.update_idletasks()
+        global _titlebar_check_pending
+        _titlebar_check_pending = None
+        # overrideredirect() membaca atribut sisi Tk; tidak perlu menguras
+        # geometri tertunda dengan update_idletasks() lebih dulu.
         if root.overrideredirect():
             print("Title bar tidak terdeteksi, aplikasi akan direstart.")
+            flush_scheduled_save_config()
+            stop_log_writer()
             os.execv(sys.executable, [sys.executable] + sys.argv)
-        else:
-            root.after(2000, cek_titlebar)
 
-    root.after(2000, cek_titlebar)
+    def schedule_cek_titlebar(event):
+        global _titlebar_check_pending
+        # Binding di root juga menerima <Configure> dari semua widget anaknya
+        if event.widget is not root or _titlebar_check_pending is not None:
+            return
+        _titlebar_check_pending = root.after(500, cek_titlebar)
+
+    root.bind("<Map>", schedule_cek_titlebar, add="+")
+    root.bind("<Configure>", schedule_cek_titlebar, add="+")
 
     root.mainloop()
 else: